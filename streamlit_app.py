@@ -8,7 +8,9 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import math
 import boto3
+from botocore.config import Config
 import json
+import hashlib
 import logging
 from datetime import datetime, timedelta
 import io
@@ -16,13 +18,15 @@ from typing import Dict, List, Tuple, Optional, Any
 import numpy as np
 import anthropic
 import requests
-import csv
-from io import StringIO
 import urllib3
 import base64
 import ssl
 from urllib.parse import quote
 import warnings
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Disable SSL warnings for vROPS connections
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -36,26 +40,23 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Try to import reportlab for PDF generation
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+# reportlab (PDF generation) is imported lazily by the report builders; only check it is installed
+REPORTLAB_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+
+# openpyxl (Excel export and upload parsing) is imported lazily by its users; only check it is installed
+OPENPYXL_AVAILABLE = importlib.util.find_spec('openpyxl') is not None
 
-# Try to import openpyxl for Excel generation
+# pyarrow (faster CSV parsing) is only used as a pandas engine; only check it is installed
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Try to import orjson for faster JSON parsing
 try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils.dataframe import dataframe_to_rows
-    OPENPYXL_AVAILABLE = True
+    import orjson
+    json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
 except ImportError:
-    OPENPYXL_AVAILABLE = False
+    json_loads = json.loads
+    ORJSON_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -682,58 +683,15 @@ class VROPSConnector:
                 'mem|swapoutRate_average'
             ]
             
-            metrics_data = {}
-            
-            # Get metrics for each key
-            for metric_key in metric_keys:
-                stats_url = f"{self.base_url}/suite-api/api/resources/{vm_id}/stats"
-                
-                params = {
-                    'statKey': metric_key,
-                    'begin': start_timestamp,
-                    'end': end_timestamp,
-                    'rollUpType': 'AVG',
-                    'intervalType': 'HOURS',
-                    'intervalQuantifier': 1
-                }
-                
-                try:
-                    response = self.session.get(stats_url, params=params, timeout=30)
-                    
-                    if response.status_code == 200:
-                        stat_data = response.json()
-                        values = stat_data.get('values', [])
-                        
-                        if values:
-                            # Extract numeric values
-                            metric_values = []
-                            for value_entry in values:
-                                if len(value_entry) >= 2 and value_entry[1] is not None:
-                                    try:
-                                        metric_values.append(float(value_entry[1]))
-                                    except (ValueError, TypeError):
-                                        continue
-                            
-                            if metric_values:
-                                metrics_data[metric_key] = {
-                                    'values': metric_values,
-                                    'average': sum(metric_values) / len(metric_values),
-                                    'max': max(metric_values),
-                                    'min': min(metric_values),
-                                    'latest': metric_values[-1] if metric_values else 0,
-                                    'samples': len(metric_values)
-                                }
-                            else:
-                                metrics_data[metric_key] = self._get_empty_metric()
-                        else:
-                            metrics_data[metric_key] = self._get_empty_metric()
-                    else:
-                        logger.warning(f"Failed to get metric {metric_key}: {response.status_code}")
-                        metrics_data[metric_key] = self._get_empty_metric()
-                        
-                except Exception as e:
-                    logger.warning(f"Error getting metric {metric_key}: {e}")
-                    metrics_data[metric_key] = self._get_empty_metric()
+            # Fetch all metric keys concurrently - each one is an independent stats request.
+            # Capped at 10 workers to match the session's default per-host connection pool.
+            stats_url = f"{self.base_url}/suite-api/api/resources/{vm_id}/stats"
+            with ThreadPoolExecutor(max_workers=min(len(metric_keys), 10)) as executor:
+                metric_results = executor.map(
+                    lambda metric_key: self._get_metric_stats(stats_url, metric_key, start_timestamp, end_timestamp),
+                    metric_keys
+                )
+                metrics_data = dict(zip(metric_keys, metric_results))
             
             # Calculate derived metrics
             processed_metrics = self._process_vm_metrics(metrics_data)
@@ -752,6 +710,49 @@ class VROPSConnector:
                 'message': f'Error getting VM metrics: {str(e)}'
             }
     
+    def _get_metric_stats(self, stats_url: str, metric_key: str, start_timestamp: int, end_timestamp: int) -> Dict[str, Any]:
+        """Get hourly statistics for a single metric key."""
+        params = {
+            'statKey': metric_key,
+            'begin': start_timestamp,
+            'end': end_timestamp,
+            'rollUpType': 'AVG',
+            'intervalType': 'HOURS',
+            'intervalQuantifier': 1
+        }
+        
+        try:
+            response = self.session.get(stats_url, params=params, timeout=30)
+            
+            if response.status_code == 200:
+                stat_data = response.json()
+                values = stat_data.get('values', [])
+                
+                if values:
+                    # Extract numeric values in one vectorized pass, dropping missing/invalid samples
+                    raw_values = [value_entry[1] for value_entry in values if len(value_entry) >= 2]
+                    metric_values = pd.to_numeric(
+                        pd.Series(raw_values, dtype=object), errors='coerce'
+                    ).dropna().to_numpy(dtype=float)
+                    
+                    if metric_values.size:
+                        return {
+                            'values': metric_values.tolist(),
+                            'average': float(metric_values.mean()),
+                            'max': float(metric_values.max()),
+                            'min': float(metric_values.min()),
+                            'latest': float(metric_values[-1]),
+                            'samples': int(metric_values.size)
+                        }
+                return self._get_empty_metric()
+            else:
+                logger.warning(f"Failed to get metric {metric_key}: {response.status_code}")
+                return self._get_empty_metric()
+                
+        except Exception as e:
+            logger.warning(f"Error getting metric {metric_key}: {e}")
+            return self._get_empty_metric()
+    
     def _get_empty_metric(self) -> Dict[str, Any]:
         """Return empty metric structure."""
         return {
@@ -1458,7 +1459,7 @@ class ClaudeAIMigrationAnalyzer:
             
             if json_match:
                 json_str = json_match.group(0)
-                parsed_response = json.loads(json_str)
+                parsed_response = json_loads(json_str)
                 
                 # Validate required fields
                 required_fields = ['complexity_score', 'complexity_level', 'migration_strategy']
@@ -1568,6 +1569,162 @@ class ClaudeAIMigrationAnalyzer:
 
 # REPLACE the existing AWSCostCalculator class (around line 1000-1500) with this improved version:
 
+# AWS region code -> Pricing API location name
+AWS_REGION_NAMES = {
+    'us-east-1': 'US East (N. Virginia)',
+    'us-east-2': 'US East (Ohio)',
+    'us-west-1': 'US West (N. California)',
+    'us-west-2': 'US West (Oregon)',
+    'eu-west-1': 'EU (Ireland)',
+    'eu-west-2': 'EU (London)',
+    'ap-southeast-1': 'Asia Pacific (Singapore)',
+    'ap-southeast-2': 'Asia Pacific (Sydney)',
+}
+
+# Selectbox choices offered in the configuration form, with value -> position lookups
+REGION_OPTIONS = ("us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1")
+REGION_INDEX = {region: i for i, region in enumerate(REGION_OPTIONS)}
+
+OS_LABELS = {
+    'linux': 'Linux (Amazon Linux, Ubuntu, RHEL)',
+    'windows': 'Windows Server'
+}
+OS_OPTIONS = tuple(OS_LABELS)
+OS_INDEX = {os_name: i for i, os_name in enumerate(OS_OPTIONS)}
+
+WORKLOAD_TYPE_LABELS = {
+    'web_application': 'Web Application (Frontend, CDN)',
+    'application_server': 'Application Server (APIs, Middleware)',
+    'database_server': 'Database Server (RDBMS, NoSQL)',
+    'file_server': 'File Server (Storage, Backup)',
+    'compute_intensive': 'Compute Intensive (HPC, Analytics)',
+    'analytics_workload': 'Analytics Workload (BI, Data Processing)'
+}
+WORKLOAD_TYPE_OPTIONS = tuple(WORKLOAD_TYPE_LABELS)
+WORKLOAD_TYPE_INDEX = {workload_type: i for i, workload_type in enumerate(WORKLOAD_TYPE_OPTIONS)}
+
+CRITICALITY_OPTIONS = ("low", "medium", "high", "critical")
+CRITICALITY_INDEX = {level: i for i, level in enumerate(CRITICALITY_OPTIONS)}
+
+def _selectbox_choices(options: tuple, index: Dict[str, int], value) -> Tuple[tuple, int]:
+    """Return selectbox options and the position of value, keeping an unknown value (e.g. an imported region) selectable."""
+    if value in index:
+        return options, index[value]
+    # Appending it avoids silently overwriting the stored input with the first option
+    return options + (value,), len(options)
+
+# Fallback EC2 hourly pricing (USD) when the AWS Pricing API is unavailable
+FALLBACK_EC2_PRICING = {
+    # General Purpose - M6i instances
+    'm6i.large': {'on_demand': 0.0864, 'ri_1y_no_upfront': 0.0605, 'ri_3y_no_upfront': 0.0432, 'spot': 0.0259},
+    'm6i.xlarge': {'on_demand': 0.1728, 'ri_1y_no_upfront': 0.1210, 'ri_3y_no_upfront': 0.0864, 'spot': 0.0518},
+    'm6i.2xlarge': {'on_demand': 0.3456, 'ri_1y_no_upfront': 0.2419, 'ri_3y_no_upfront': 0.1728, 'spot': 0.1037},
+    'm6i.4xlarge': {'on_demand': 0.6912, 'ri_1y_no_upfront': 0.4838, 'ri_3y_no_upfront': 0.3456, 'spot': 0.2074},
+    'm6i.8xlarge': {'on_demand': 1.3824, 'ri_1y_no_upfront': 0.9677, 'ri_3y_no_upfront': 0.6912, 'spot': 0.4147},
+    
+    # Memory Optimized - R6i instances  
+    'r6i.large': {'on_demand': 0.1008, 'ri_1y_no_upfront': 0.0706, 'ri_3y_no_upfront': 0.0504, 'spot': 0.0302},
+    'r6i.xlarge': {'on_demand': 0.2016, 'ri_1y_no_upfront': 0.1411, 'ri_3y_no_upfront': 0.1008, 'spot': 0.0605},
+    'r6i.2xlarge': {'on_demand': 0.4032, 'ri_1y_no_upfront': 0.2822, 'ri_3y_no_upfront': 0.2016, 'spot': 0.1210},
+    'r6i.4xlarge': {'on_demand': 0.8064, 'ri_1y_no_upfront': 0.5645, 'ri_3y_no_upfront': 0.4032, 'spot': 0.2419},
+    
+    # Compute Optimized - C6i instances
+    'c6i.large': {'on_demand': 0.0765, 'ri_1y_no_upfront': 0.0536, 'ri_3y_no_upfront': 0.0383, 'spot': 0.0230},
+    'c6i.xlarge': {'on_demand': 0.1530, 'ri_1y_no_upfront': 0.1071, 'ri_3y_no_upfront': 0.0765, 'spot': 0.0459},
+    'c6i.2xlarge': {'on_demand': 0.3060, 'ri_1y_no_upfront': 0.2142, 'ri_3y_no_upfront': 0.1530, 'spot': 0.0918},
+    'c6i.4xlarge': {'on_demand': 0.6120, 'ri_1y_no_upfront': 0.4284, 'ri_3y_no_upfront': 0.3060, 'spot': 0.1836},
+    
+    # Burstable - T3 instances
+    't3.micro': {'on_demand': 0.0104, 'ri_1y_no_upfront': 0.0062, 'ri_3y_no_upfront': 0.0041, 'spot': 0.0031},
+    't3.small': {'on_demand': 0.0208, 'ri_1y_no_upfront': 0.0125, 'ri_3y_no_upfront': 0.0083, 'spot': 0.0062},
+    't3.medium': {'on_demand': 0.0416, 'ri_1y_no_upfront': 0.0250, 'ri_3y_no_upfront': 0.0166, 'spot': 0.0125},
+    't3.large': {'on_demand': 0.0832, 'ri_1y_no_upfront': 0.0499, 'ri_3y_no_upfront': 0.0333, 'spot': 0.0250},
+}
+
+DEFAULT_FALLBACK_PRICING = {
+    'on_demand': 0.1, 'ri_1y_no_upfront': 0.07, 'ri_3y_no_upfront': 0.05, 'spot': 0.03
+}
+
+PRICING_MODELS = ('on_demand', 'ri_1y_no_upfront', 'ri_3y_no_upfront', 'spot')
+
+# Environments sized and priced as production (multi-AZ, HA add-ons)
+PRODUCTION_ENVIRONMENTS = frozenset({'PROD', 'PREPROD'})
+
+# Service categories priced by AWSCostCalculator.calculate_service_costs, in display order
+SERVICE_CATEGORIES = ('compute', 'network', 'storage', 'database', 'security', 'monitoring')
+
+# Licensing surcharge applied on top of Linux pricing, keyed by lower-cased OS
+OS_PRICING_MULTIPLIERS = {
+    'linux': 1.0,
+    'windows': 1.3  # 30% increase for Windows licensing
+}
+
+# Pricing lookups run on the script thread while the page renders; keep retries and timeouts
+# short so a throttled or slow call falls back to FALLBACK_EC2_PRICING instead of blocking the UI
+PRICING_CLIENT_CONFIG = Config(
+    retries={'mode': 'standard', 'max_attempts': 3},
+    connect_timeout=5,
+    read_timeout=10
+)
+
+@st.cache_resource(show_spinner=False)
+def _get_pricing_client(access_key_id: Optional[str] = None, secret_access_key: Optional[str] = None):
+    """Get a shared AWS Pricing API client, created once per credential set."""
+    if access_key_id and secret_access_key:
+        return boto3.client(
+            'pricing',
+            region_name='us-east-1',  # Pricing API only available in us-east-1
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+            config=PRICING_CLIENT_CONFIG
+        )
+    return boto3.client('pricing', region_name='us-east-1', config=PRICING_CLIENT_CONFIG)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _check_pricing_api_access(_pricing_client, credential_source: str) -> bool:
+    """Verify Pricing API access with a minimal call; only successes are cached."""
+    _pricing_client.get_products(ServiceCode='AmazonEC2', MaxResults=1)
+    return True
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _fetch_real_ec2_pricing(_pricing_client, instance_type: str, location: str) -> Optional[Dict[str, Any]]:
+    """Fetch On-Demand Linux pricing for an instance type, cached for a day across sessions."""
+    filters = [
+        {'Type': 'TERM_MATCH', 'Field': 'instanceType', 'Value': instance_type},
+        {'Type': 'TERM_MATCH', 'Field': 'location', 'Value': location},
+        {'Type': 'TERM_MATCH', 'Field': 'operatingSystem', 'Value': 'Linux'},
+        {'Type': 'TERM_MATCH', 'Field': 'preInstalledSw', 'Value': 'NA'},
+        {'Type': 'TERM_MATCH', 'Field': 'tenancy', 'Value': 'Shared'},
+        # Exclude capacity-reservation SKUs so only the regular On-Demand product matches
+        {'Type': 'TERM_MATCH', 'Field': 'capacitystatus', 'Value': 'Used'},
+    ]
+    
+    response = _pricing_client.get_products(
+        ServiceCode='AmazonEC2',
+        Filters=filters,
+        MaxResults=1
+    )
+    
+    # Parse pricing data
+    for price_item in response['PriceList']:
+        data = json_loads(price_item)
+        terms = data.get('terms', {})
+        
+        # Get On-Demand pricing
+        on_demand = terms.get('OnDemand', {})
+        for term_data in on_demand.values():
+            price_dimensions = term_data.get('priceDimensions', {})
+            for dim_data in price_dimensions.values():
+                usd_price = dim_data.get('pricePerUnit', {}).get('USD')
+                if usd_price:
+                    return {
+                        'on_demand': float(usd_price),
+                        'source': 'aws_api',
+                        'last_updated': datetime.now().isoformat()
+                    }
+    
+    return None
+
 class AWSCostCalculator:
     """Enhanced AWS service cost calculator with real API integration and better error handling."""
     
@@ -1650,20 +1807,17 @@ class AWSCostCalculator:
     def _initialize_aws_connection(self):
         """Initialize AWS connection with enhanced error handling."""
         try:
-            import boto3
-            from botocore.exceptions import NoCredentialsError, PartialCredentialsError, ClientError
+            from botocore.exceptions import NoCredentialsError, PartialCredentialsError
             
             # Option 1: Try Streamlit secrets first
             if hasattr(st, 'secrets') and 'aws' in st.secrets:
                 try:
-                    self.pricing_client = boto3.client(
-                        'pricing',
-                        region_name='us-east-1',  # Pricing API only available in us-east-1
-                        aws_access_key_id=st.secrets['aws']['access_key_id'],
-                        aws_secret_access_key=st.secrets['aws']['secret_access_key']
+                    self.pricing_client = _get_pricing_client(
+                        st.secrets['aws']['access_key_id'],
+                        st.secrets['aws']['secret_access_key']
                     )
                     # Test the connection
-                    self._test_aws_connection()
+                    self._test_aws_connection(st.secrets['aws']['access_key_id'])
                     logger.info("✅ Using AWS credentials from Streamlit secrets")
                     return
                 except Exception as e:
@@ -1672,7 +1826,7 @@ class AWSCostCalculator:
             
             # Option 2: Use default credential chain
             try:
-                self.pricing_client = boto3.client('pricing', region_name='us-east-1')
+                self.pricing_client = _get_pricing_client()
                 # Test the connection
                 self._test_aws_connection()
                 logger.info("✅ Using AWS credentials from default credential chain")
@@ -1694,14 +1848,11 @@ class AWSCostCalculator:
             self.connection_error = f"Unexpected error: {str(e)}"
             logger.error(f"⚠️ Unexpected AWS connection error: {e}")
     
-    def _test_aws_connection(self):
+    def _test_aws_connection(self, credential_source: str = 'default'):
         """Test AWS connection with minimal API call."""
         try:
-            # Test with a minimal API call
-            test_response = self.pricing_client.get_products(
-                ServiceCode='AmazonEC2', 
-                MaxResults=1
-            )
+            # Test with a minimal API call, reused for a few minutes per credential source
+            _check_pricing_api_access(self.pricing_client, credential_source)
             self.aws_connected = True
             self.connection_error = None
             logger.info("✅ AWS Pricing API connection test successful")
@@ -1725,40 +1876,7 @@ class AWSCostCalculator:
             return None
             
         try:
-            filters = [
-                {'Type': 'TERM_MATCH', 'Field': 'instanceType', 'Value': instance_type},
-                {'Type': 'TERM_MATCH', 'Field': 'location', 'Value': self._get_region_name(self.region)},
-                {'Type': 'TERM_MATCH', 'Field': 'operatingSystem', 'Value': 'Linux'},
-                {'Type': 'TERM_MATCH', 'Field': 'preInstalledSw', 'Value': 'NA'},
-                {'Type': 'TERM_MATCH', 'Field': 'tenancy', 'Value': 'Shared'},
-            ]
-            
-            response = self.pricing_client.get_products(
-                ServiceCode='AmazonEC2',
-                Filters=filters,
-                MaxResults=10
-            )
-            
-            if response['PriceList']:
-                # Parse pricing data
-                for price_item in response['PriceList']:
-                    data = json.loads(price_item)
-                    terms = data.get('terms', {})
-                    
-                    # Get On-Demand pricing
-                    on_demand = terms.get('OnDemand', {})
-                    for term_data in on_demand.values():
-                        price_dimensions = term_data.get('priceDimensions', {})
-                        for dim_data in price_dimensions.values():
-                            usd_price = dim_data.get('pricePerUnit', {}).get('USD')
-                            if usd_price:
-                                return {
-                                    'on_demand': float(usd_price),
-                                    'source': 'aws_api',
-                                    'last_updated': datetime.now().isoformat()
-                                }
-            
-            return None
+            return _fetch_real_ec2_pricing(self.pricing_client, instance_type, self._get_region_name(self.region))
             
         except Exception as e:
             logger.error(f"Error getting real pricing for {instance_type}: {e}")
@@ -1787,51 +1905,20 @@ class AWSCostCalculator:
             pricing = self._get_fallback_pricing(instance_type)
         
         # Apply Windows licensing cost
-        if operating_system.lower() == 'windows':
-            windows_multiplier = 1.3  # 30% increase for Windows licensing
+        os_key = operating_system.lower()
+        os_multiplier = OS_PRICING_MULTIPLIERS.get(os_key, 1.0)
+        if os_multiplier != 1.0:
+            for pricing_model in PRICING_MODELS:
+                pricing[pricing_model] *= os_multiplier
             
-            for pricing_model in pricing:
-                if pricing_model not in ['source', 'last_updated']:
-                    pricing[pricing_model] = pricing[pricing_model] * windows_multiplier
-            
-            pricing['source'] = pricing.get('source', 'fallback') + '_windows'
+            pricing['source'] = pricing.get('source', 'fallback') + f'_{os_key}'
         
         return pricing
 
     def _get_fallback_pricing(self, instance_type: str) -> dict:
         """Get fallback pricing with enhanced instance types."""
         
-        # Enhanced fallback pricing with more instance types
-        fallback_prices = {
-            # General Purpose - M6i instances
-            'm6i.large': {'on_demand': 0.0864, 'ri_1y_no_upfront': 0.0605, 'ri_3y_no_upfront': 0.0432, 'spot': 0.0259},
-            'm6i.xlarge': {'on_demand': 0.1728, 'ri_1y_no_upfront': 0.1210, 'ri_3y_no_upfront': 0.0864, 'spot': 0.0518},
-            'm6i.2xlarge': {'on_demand': 0.3456, 'ri_1y_no_upfront': 0.2419, 'ri_3y_no_upfront': 0.1728, 'spot': 0.1037},
-            'm6i.4xlarge': {'on_demand': 0.6912, 'ri_1y_no_upfront': 0.4838, 'ri_3y_no_upfront': 0.3456, 'spot': 0.2074},
-            'm6i.8xlarge': {'on_demand': 1.3824, 'ri_1y_no_upfront': 0.9677, 'ri_3y_no_upfront': 0.6912, 'spot': 0.4147},
-            
-            # Memory Optimized - R6i instances  
-            'r6i.large': {'on_demand': 0.1008, 'ri_1y_no_upfront': 0.0706, 'ri_3y_no_upfront': 0.0504, 'spot': 0.0302},
-            'r6i.xlarge': {'on_demand': 0.2016, 'ri_1y_no_upfront': 0.1411, 'ri_3y_no_upfront': 0.1008, 'spot': 0.0605},
-            'r6i.2xlarge': {'on_demand': 0.4032, 'ri_1y_no_upfront': 0.2822, 'ri_3y_no_upfront': 0.2016, 'spot': 0.1210},
-            'r6i.4xlarge': {'on_demand': 0.8064, 'ri_1y_no_upfront': 0.5645, 'ri_3y_no_upfront': 0.4032, 'spot': 0.2419},
-            
-            # Compute Optimized - C6i instances
-            'c6i.large': {'on_demand': 0.0765, 'ri_1y_no_upfront': 0.0536, 'ri_3y_no_upfront': 0.0383, 'spot': 0.0230},
-            'c6i.xlarge': {'on_demand': 0.1530, 'ri_1y_no_upfront': 0.1071, 'ri_3y_no_upfront': 0.0765, 'spot': 0.0459},
-            'c6i.2xlarge': {'on_demand': 0.3060, 'ri_1y_no_upfront': 0.2142, 'ri_3y_no_upfront': 0.1530, 'spot': 0.0918},
-            'c6i.4xlarge': {'on_demand': 0.6120, 'ri_1y_no_upfront': 0.4284, 'ri_3y_no_upfront': 0.3060, 'spot': 0.1836},
-            
-            # Burstable - T3 instances
-            't3.micro': {'on_demand': 0.0104, 'ri_1y_no_upfront': 0.0062, 'ri_3y_no_upfront': 0.0041, 'spot': 0.0031},
-            't3.small': {'on_demand': 0.0208, 'ri_1y_no_upfront': 0.0125, 'ri_3y_no_upfront': 0.0083, 'spot': 0.0062},
-            't3.medium': {'on_demand': 0.0416, 'ri_1y_no_upfront': 0.0250, 'ri_3y_no_upfront': 0.0166, 'spot': 0.0125},
-            't3.large': {'on_demand': 0.0832, 'ri_1y_no_upfront': 0.0499, 'ri_3y_no_upfront': 0.0333, 'spot': 0.0250},
-        }
-        
-        pricing = fallback_prices.get(instance_type, {
-            'on_demand': 0.1, 'ri_1y_no_upfront': 0.07, 'ri_3y_no_upfront': 0.05, 'spot': 0.03
-        })
+        pricing = dict(FALLBACK_EC2_PRICING.get(instance_type, DEFAULT_FALLBACK_PRICING))
         
         # Add metadata
         pricing.update({
@@ -1879,24 +1966,16 @@ class AWSCostCalculator:
             operating_system = self.inputs.get('operating_system', 'linux')
             pricing = self._get_ec2_pricing_with_os(selected_instance['type'], operating_system)
             
-            on_demand_monthly = pricing['on_demand'] * 730
-            ri_1y_monthly = pricing['ri_1y_no_upfront'] * 730
-            ri_3y_monthly = pricing['ri_3y_no_upfront'] * 730
-            
             storage_monthly = max(self.inputs.get('storage_current_gb', 500), 100) * 0.08
             network_monthly = 50
+            fixed_monthly = storage_monthly + network_monthly
             
-            total_on_demand = on_demand_monthly + storage_monthly + network_monthly
-            total_ri_1y = ri_1y_monthly + storage_monthly + network_monthly
-            total_ri_3y = ri_3y_monthly + storage_monthly + network_monthly
-            
-            costs = {
-                'on_demand': total_on_demand,
-                'ri_1y_no_upfront': total_ri_1y,
-                'ri_3y_no_upfront': total_ri_3y
-            }
+            # Monthly total per commitment option (spot is not considered for TCO)
+            costs = {model: pricing[model] * 730 + fixed_monthly
+                     for model in ('on_demand', 'ri_1y_no_upfront', 'ri_3y_no_upfront')}
+            total_on_demand = costs['on_demand']
             
-            best_option = min(costs.keys(), key=lambda k: costs[k])
+            best_option = min(costs, key=costs.get)
             best_cost = costs[best_option]
             savings = total_on_demand - best_cost
             
@@ -1951,17 +2030,7 @@ class AWSCostCalculator:
 
     def _get_region_name(self, region_code: str) -> str:
         """Map AWS region code to full name."""
-        region_map = {
-            'us-east-1': 'US East (N. Virginia)',
-            'us-east-2': 'US East (Ohio)',
-            'us-west-1': 'US West (N. California)',
-            'us-west-2': 'US West (Oregon)',
-            'eu-west-1': 'EU (Ireland)',
-            'eu-west-2': 'EU (London)',
-            'ap-southeast-1': 'Asia Pacific (Singapore)',
-            'ap-southeast-2': 'Asia Pacific (Sydney)',
-        }
-        return region_map.get(region_code, region_code)
+        return AWS_REGION_NAMES.get(region_code, region_code)
     
     def calculate_service_costs(self, env: str, tech_recs: Dict, requirements: Dict) -> Dict[str, Any]:
         """Calculate detailed costs for all AWS services."""
@@ -1982,7 +2051,7 @@ class AWSCostCalculator:
         costs['summary'] = {
             'total_monthly': total_monthly,
             'total_annual': total_annual,
-            'largest_cost_category': max(costs.keys(), key=lambda k: costs[k]['total'] if k != 'summary' else 0)
+            'largest_cost_category': max(costs, key=lambda k: costs[k]['total'])
         }
         
         return costs
@@ -2001,7 +2070,7 @@ class AWSCostCalculator:
         
         # Determine pricing model
         pricing_model = 'on_demand'
-        if env in ['PROD', 'PREPROD']:
+        if env in PRODUCTION_ENVIRONMENTS:
             pricing_model = 'ri_1y_no_upfront'
         
         monthly_instance_cost = instance_pricing[pricing_model] * instance_count * 730  # hours per month
@@ -2011,7 +2080,7 @@ class AWSCostCalculator:
         max_instances = scaling_info.get('max_instances', instance_count)
         
         # Elastic IP costs (if needed)
-        eip_cost = self.pricing['compute']['elastic_ip'] * instance_count * 730 if env in ['PROD', 'PREPROD'] else 0
+        eip_cost = self.pricing['compute']['elastic_ip'] * instance_count * 730 if env in PRODUCTION_ENVIRONMENTS else 0
         
         total_compute = monthly_instance_cost + eip_cost
         
@@ -2055,7 +2124,7 @@ class AWSCostCalculator:
         # NAT Gateway costs
         nat_cost = 0
         if network_recs.get('nat_gateway') == 'Required':
-            nat_count = 2 if env in ['PROD', 'PREPROD'] else 1
+            nat_count = 2 if env in PRODUCTION_ENVIRONMENTS else 1
             nat_cost = self.pricing['network']['nat_gateway'] * nat_count * 730
         
         # CloudFront costs (estimated)
@@ -2135,7 +2204,7 @@ class AWSCostCalculator:
         
         # S3 costs for long-term backup/archival
         s3_cost = 0
-        if env in ['PROD', 'PREPROD']:
+        if env in PRODUCTION_ENVIRONMENTS:
             s3_storage_gb = storage_gb * 2
             s3_cost = s3_storage_gb * self.pricing['storage']['s3']['standard_ia']
         
@@ -2253,18 +2322,18 @@ class AWSCostCalculator:
         
         # GuardDuty (production environments)
         guardduty_cost = 0
-        if env in ['PROD', 'PREPROD']:
+        if env in PRODUCTION_ENVIRONMENTS:
             guardduty_cost = self.pricing['security']['guardduty']
         
         # Security Hub
         security_hub_cost = 0
-        if env in ['PROD', 'PREPROD']:
+        if env in PRODUCTION_ENVIRONMENTS:
             findings_per_month = 1000
             security_hub_cost = findings_per_month * self.pricing['security']['security_hub']
         
         # WAF (if web application)
         waf_cost = 0
-        if env in ['PROD', 'PREPROD']:
+        if env in PRODUCTION_ENVIRONMENTS:
             waf_cost = self.pricing['security']['waf']
         
         total_security = secrets_cost + kms_cost + config_cost + cloudtrail_cost + guardduty_cost + security_hub_cost + waf_cost
@@ -2461,7 +2530,7 @@ class AWSCostCalculator:
     def _get_compute_optimization_notes(self, env: str, instance_type: str, pricing_model: str) -> List[str]:
         """Get compute optimization recommendations."""
         notes = []
-        if pricing_model == 'on_demand' and env in ['PROD', 'PREPROD']:
+        if pricing_model == 'on_demand' and env in PRODUCTION_ENVIRONMENTS:
             notes.append("💡 Consider Reserved Instances for 20-40% cost savings")
         if 'large' in instance_type and env == 'DEV':
             notes.append("💡 Consider smaller instances for development environment")
@@ -2484,7 +2553,7 @@ class AWSCostCalculator:
             "💡 Use gp3 volumes for better price-performance ratio",
             "💡 Implement lifecycle policies for S3 backup storage"
         ]
-        if env in ['PROD', 'PREPROD']:
+        if env in PRODUCTION_ENVIRONMENTS:
             notes.append("💡 Consider EBS snapshots cross-region replication")
         return notes
     
@@ -2518,12 +2587,69 @@ class AWSCostCalculator:
             notes.append("💡 Reduce monitoring frequency for development environments")
         return notes
         
+@st.cache_resource(ttl=300, show_spinner=False)
+def _get_cost_calculator() -> AWSCostCalculator:
+    """Get the AWSCostCalculator shared by all reruns and sessions, rebuilt every few minutes to refresh its connection status."""
+    return AWSCostCalculator()
+
 class EnhancedEnvironmentAnalyzer:
     """Enhanced environment analyzer with detailed complexity explanations."""
     
+    # Per-environment complexity factor tables
+    MIGRATION_BASE_RISK = {'DEV': 20, 'QA': 30, 'UAT': 50, 'PREPROD': 70, 'PROD': 90}
+    COMPLIANCE_SCORES = {'DEV': 10, 'QA': 20, 'UAT': 40, 'PREPROD': 70, 'PROD': 95}
+    INTEGRATION_SCORES = {'DEV': 30, 'QA': 45, 'UAT': 60, 'PREPROD': 80, 'PROD': 95}
+    
+    # Operational complexity profile by environment
+    OPERATIONAL_COMPLEXITY = {
+        'DEV': {
+            'score': 25,
+            'factors': ['Minimal SLA requirements', 'Simple monitoring', 'Basic security'],
+            'description': 'Low operational complexity - development environment'
+        },
+        'QA': {
+            'score': 35,
+            'factors': ['Automated testing integration', 'Test data management'],
+            'description': 'Low-medium complexity - automated testing requirements'
+        },
+        'UAT': {
+            'score': 55,
+            'factors': ['User access management', 'Performance validation'],
+            'description': 'Medium complexity - user acceptance validation'
+        },
+        'PREPROD': {
+            'score': 75,
+            'factors': ['Production-like configuration', 'Advanced monitoring'],
+            'description': 'High complexity - production simulation requirements'
+        },
+        'PROD': {
+            'score': 90,
+            'factors': ['24/7 availability', 'Advanced monitoring & alerting', 'Disaster recovery'],
+            'description': 'Very high complexity - business-critical operations'
+        }
+    }
+    
+    # Compliance requirements by environment
+    COMPLIANCE_REQUIREMENTS = {
+        'DEV': ['Basic security standards', 'Data protection'],
+        'QA': ['Testing data compliance', 'Security standards'],
+        'UAT': ['User data protection', 'Business compliance'],
+        'PREPROD': ['Production-like compliance', 'Security validation'],
+        'PROD': ['Full regulatory compliance', 'Audit requirements', 'Data sovereignty']
+    }
+    
+    # Integration points by environment
+    INTEGRATION_POINTS = {
+        'DEV': ['CI/CD systems', 'Development tools', 'Version control'],
+        'QA': ['Testing frameworks', 'Test data systems', 'Reporting tools'],
+        'UAT': ['Business applications', 'User directories', 'Approval systems'],
+        'PREPROD': ['Production integrations', 'Monitoring systems', 'External APIs'],
+        'PROD': ['All business systems', 'External partners', 'Real-time integrations']
+    }
+    
     def __init__(self):
         self.environments = ['DEV', 'QA', 'UAT', 'PREPROD', 'PROD']
-        self.cost_calculator = AWSCostCalculator()
+        self.cost_calculator = _get_cost_calculator()
         
     def get_detailed_complexity_explanation(self, env: str, env_results: Dict) -> Dict[str, Any]:
         """Get detailed explanation of environment complexity."""
@@ -2572,8 +2698,7 @@ class EnhancedEnvironmentAnalyzer:
     
     def _calculate_migration_risk(self, env: str, claude_analysis: Dict) -> Dict[str, Any]:
         """Calculate migration risk factor."""
-        base_risks = {'DEV': 20, 'QA': 30, 'UAT': 50, 'PREPROD': 70, 'PROD': 90}
-        base_score = base_risks.get(env, 50)
+        base_score = self.MIGRATION_BASE_RISK.get(env, 50)
         
         complexity_multiplier = claude_analysis.get('complexity_score', 50) / 50
         final_score = min(base_score * complexity_multiplier, 100)
@@ -2587,39 +2712,11 @@ class EnhancedEnvironmentAnalyzer:
     
     def _calculate_operational_complexity(self, env: str) -> Dict[str, Any]:
         """Calculate operational complexity."""
-        complexity_factors = {
-            'DEV': {
-                'score': 25,
-                'factors': ['Minimal SLA requirements', 'Simple monitoring', 'Basic security'],
-                'description': 'Low operational complexity - development environment'
-            },
-            'QA': {
-                'score': 35,
-                'factors': ['Automated testing integration', 'Test data management'],
-                'description': 'Low-medium complexity - automated testing requirements'
-            },
-            'UAT': {
-                'score': 55,
-                'factors': ['User access management', 'Performance validation'],
-                'description': 'Medium complexity - user acceptance validation'
-            },
-            'PREPROD': {
-                'score': 75,
-                'factors': ['Production-like configuration', 'Advanced monitoring'],
-                'description': 'High complexity - production simulation requirements'
-            },
-            'PROD': {
-                'score': 90,
-                'factors': ['24/7 availability', 'Advanced monitoring & alerting', 'Disaster recovery'],
-                'description': 'Very high complexity - business-critical operations'
-            }
-        }
-        return complexity_factors.get(env, {'score': 50, 'factors': [], 'description': 'Medium complexity'})
+        return self.OPERATIONAL_COMPLEXITY.get(env, {'score': 50, 'factors': [], 'description': 'Medium complexity'})
     
     def _calculate_compliance_complexity(self, env: str) -> Dict[str, Any]:
         """Calculate compliance complexity."""
-        compliance_scores = {'DEV': 10, 'QA': 20, 'UAT': 40, 'PREPROD': 70, 'PROD': 95}
-        score = compliance_scores.get(env, 50)
+        score = self.COMPLIANCE_SCORES.get(env, 50)
         
         return {
             'score': score,
@@ -2630,8 +2727,7 @@ class EnhancedEnvironmentAnalyzer:
     
     def _calculate_integration_complexity(self, env: str) -> Dict[str, Any]:
         """Calculate integration complexity."""
-        integration_scores = {'DEV': 30, 'QA': 45, 'UAT': 60, 'PREPROD': 80, 'PROD': 95}
-        score = integration_scores.get(env, 50)
+        score = self.INTEGRATION_SCORES.get(env, 50)
         
         return {
             'score': score,
@@ -2920,7 +3016,7 @@ class EnhancedEnvironmentAnalyzer:
         config = db_configs.get(env, db_configs['UAT'])
         config.update({
             'read_replicas': self._get_read_replica_config(env),
-            'connection_pooling': 'RDS Proxy' if env in ['PREPROD', 'PROD'] else 'Application-level',
+            'connection_pooling': 'RDS Proxy' if env in PRODUCTION_ENVIRONMENTS else 'Application-level',
             'maintenance_window': self._get_maintenance_window(env)
         })
         return config
@@ -3030,14 +3126,7 @@ class EnhancedEnvironmentAnalyzer:
         else: return "Basic Compliance"
     
     def _get_compliance_requirements(self, env: str) -> List[str]:
-        requirements = {
-            'DEV': ['Basic security standards', 'Data protection'],
-            'QA': ['Testing data compliance', 'Security standards'],
-            'UAT': ['User data protection', 'Business compliance'],
-            'PREPROD': ['Production-like compliance', 'Security validation'],
-            'PROD': ['Full regulatory compliance', 'Audit requirements', 'Data sovereignty']
-        }
-        return requirements.get(env, ['Standard compliance'])
+        return self.COMPLIANCE_REQUIREMENTS.get(env, ['Standard compliance'])
     
     def _get_integration_level(self, score: float) -> str:
         if score > 80: return "Complex"
@@ -3045,14 +3134,7 @@ class EnhancedEnvironmentAnalyzer:
         else: return "Simple"
     
     def _get_integration_points(self, env: str) -> List[str]:
-        integrations = {
-            'DEV': ['CI/CD systems', 'Development tools', 'Version control'],
-            'QA': ['Testing frameworks', 'Test data systems', 'Reporting tools'],
-            'UAT': ['Business applications', 'User directories', 'Approval systems'],
-            'PREPROD': ['Production integrations', 'Monitoring systems', 'External APIs'],
-            'PROD': ['All business systems', 'External partners', 'Real-time integrations']
-        }
-        return integrations.get(env, ['Standard integrations'])
+        return self.INTEGRATION_POINTS.get(env, ['Standard integrations'])
     
     def _get_placement_strategy(self, env: str) -> str:
         strategies = {
@@ -3089,7 +3171,7 @@ class EnhancedEnvironmentAnalyzer:
         return multipliers.get(env, 1.2)
     
     def _get_iops_recommendation(self, env: str, storage_gb: int) -> str:
-        if env in ['PREPROD', 'PROD']:
+        if env in PRODUCTION_ENVIRONMENTS:
             return f"{max(storage_gb * 3, 1000)} IOPS (Provisioned)"
         else:
             return f"{storage_gb * 3} IOPS (Baseline gp3)"
@@ -3137,77 +3219,84 @@ class EnhancedEnvironmentAnalyzer:
 class EnhancedEnterpriseEC2Calculator:
     """Enhanced calculator with comprehensive instance types and environment support plus vROPS integration."""
     
-    def __init__(self):
+    # Comprehensive instance types
+    INSTANCE_TYPES = [
+        {
+            "type": "m6i.large", "vCPU": 2, "RAM": 8, "max_ebs_bandwidth": 4750,
+            "network": "Up to 12.5 Gbps", "family": "general", "processor": "Intel Xeon Ice Lake",
+            "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
+            "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
+        },
+        {
+            "type": "m6i.xlarge", "vCPU": 4, "RAM": 16, "max_ebs_bandwidth": 9500,
+            "network": "Up to 12.5 Gbps", "family": "general", "processor": "Intel Xeon Ice Lake",
+            "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
+            "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
+        },
+        {
+            "type": "m6i.2xlarge", "vCPU": 8, "RAM": 32, "max_ebs_bandwidth": 19000,
+            "network": "Up to 12.5 Gbps", "family": "general", "processor": "Intel Xeon Ice Lake",
+            "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
+            "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
+        },
+        {
+            "type": "m6i.4xlarge", "vCPU": 16, "RAM": 64, "max_ebs_bandwidth": 38000,
+            "network": "Up to 12.5 Gbps", "family": "general", "processor": "Intel Xeon Ice Lake",
+            "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
+            "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
+        },
+        {
+            "type": "r6i.large", "vCPU": 2, "RAM": 16, "max_ebs_bandwidth": 4750,
+            "network": "Up to 12.5 Gbps", "family": "memory", "processor": "Intel Xeon Ice Lake",
+            "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
+            "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
+        },
+        {
+            "type": "r6i.xlarge", "vCPU": 4, "RAM": 32, "max_ebs_bandwidth": 9500,
+            "network": "Up to 12.5 Gbps", "family": "memory", "processor": "Intel Xeon Ice Lake",
+            "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
+            "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
+        }
+    ]
+    
+    # Catalogue ordered by vCPU so the best-instance scan can stop early
+    INSTANCE_TYPES_BY_VCPU = sorted(INSTANCE_TYPES, key=lambda instance: instance['vCPU'])
+    
+    # Environment multipliers
+    ENV_MULTIPLIERS = {
+        "PROD": {"cpu_ram": 1.0, "storage": 1.0, "description": "Production environment"},
+        "PREPROD": {"cpu_ram": 0.9, "storage": 0.9, "description": "Pre-production environment"},
+        "UAT": {"cpu_ram": 0.7, "storage": 0.7, "description": "User acceptance testing"},
+        "QA": {"cpu_ram": 0.6, "storage": 0.6, "description": "Quality assurance"},
+        "DEV": {"cpu_ram": 0.4, "storage": 0.4, "description": "Development environment"}
+    }
+    
+    # Inputs every new calculator starts from (copied, never mutated)
+    DEFAULT_INPUTS = {
+        "workload_name": "Sample Enterprise Workload",
+        "workload_type": "web_application",
+        "operating_system": "linux",
+        "region": "us-east-1",
+        "on_prem_cores": 8,
+        "peak_cpu_percent": 70,
+        "on_prem_ram_gb": 32,
+        "peak_ram_percent": 80,
+        "storage_current_gb": 500,
+        "storage_growth_rate": 0.15,
+        "peak_iops": 5000,
+        "peak_throughput_mbps": 250,
+        "infrastructure_age_years": 3,
+        "business_criticality": "medium"
+    }
+    
+    def __init__(self, inputs: Dict = None, claude_analyzer: ClaudeAIMigrationAnalyzer = None):
         try:
-            self.claude_analyzer = ClaudeAIMigrationAnalyzer()
+            # The analyzer is stateless, so bulk runs can share one across calculators
+            self.claude_analyzer = claude_analyzer or ClaudeAIMigrationAnalyzer()
             self.vrops_processor = VROPSMetricsProcessor()
             
-            # Comprehensive instance types
-            self.INSTANCE_TYPES = [
-                {
-                    "type": "m6i.large", "vCPU": 2, "RAM": 8, "max_ebs_bandwidth": 4750,
-                    "network": "Up to 12.5 Gbps", "family": "general", "processor": "Intel Xeon Ice Lake",
-                    "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
-                    "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
-                },
-                {
-                    "type": "m6i.xlarge", "vCPU": 4, "RAM": 16, "max_ebs_bandwidth": 9500,
-                    "network": "Up to 12.5 Gbps", "family": "general", "processor": "Intel Xeon Ice Lake",
-                    "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
-                    "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
-                },
-                {
-                    "type": "m6i.2xlarge", "vCPU": 8, "RAM": 32, "max_ebs_bandwidth": 19000,
-                    "network": "Up to 12.5 Gbps", "family": "general", "processor": "Intel Xeon Ice Lake",
-                    "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
-                    "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
-                },
-                {
-                    "type": "m6i.4xlarge", "vCPU": 16, "RAM": 64, "max_ebs_bandwidth": 38000,
-                    "network": "Up to 12.5 Gbps", "family": "general", "processor": "Intel Xeon Ice Lake",
-                    "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
-                    "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
-                },
-                {
-                    "type": "r6i.large", "vCPU": 2, "RAM": 16, "max_ebs_bandwidth": 4750,
-                    "network": "Up to 12.5 Gbps", "family": "memory", "processor": "Intel Xeon Ice Lake",
-                    "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
-                    "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
-                },
-                {
-                    "type": "r6i.xlarge", "vCPU": 4, "RAM": 32, "max_ebs_bandwidth": 9500,
-                    "network": "Up to 12.5 Gbps", "family": "memory", "processor": "Intel Xeon Ice Lake",
-                    "architecture": "x86_64", "storage": "EBS Only", "network_performance": "Up to 12.5 Gigabit",
-                    "ebs_optimized": True, "enhanced_networking": True, "placement_group": True
-                }
-            ]
-            
-            # Environment multipliers
-            self.ENV_MULTIPLIERS = {
-                "PROD": {"cpu_ram": 1.0, "storage": 1.0, "description": "Production environment"},
-                "PREPROD": {"cpu_ram": 0.9, "storage": 0.9, "description": "Pre-production environment"},
-                "UAT": {"cpu_ram": 0.7, "storage": 0.7, "description": "User acceptance testing"},
-                "QA": {"cpu_ram": 0.6, "storage": 0.6, "description": "Quality assurance"},
-                "DEV": {"cpu_ram": 0.4, "storage": 0.4, "description": "Development environment"}
-            }
-            
-            # Default inputs
-            self.inputs = {
-                "workload_name": "Sample Enterprise Workload",
-                "workload_type": "web_application",
-                "operating_system": "linux",
-                "region": "us-east-1",
-                "on_prem_cores": 8,
-                "peak_cpu_percent": 70,
-                "on_prem_ram_gb": 32,
-                "peak_ram_percent": 80,
-                "storage_current_gb": 500,
-                "storage_growth_rate": 0.15,
-                "peak_iops": 5000,
-                "peak_throughput_mbps": 250,
-                "infrastructure_age_years": 3,
-                "business_criticality": "medium"
-            }
+            # Default inputs, overridden by any inputs bound at construction
+            self.inputs = {**self.DEFAULT_INPUTS, **(inputs or {})}
             
             logger.info("Enhanced calculator initialized successfully")
         except Exception as e:
@@ -3280,45 +3369,48 @@ class EnhancedEnterpriseEC2Calculator:
             required_ram = max(math.ceil(self.inputs["on_prem_ram_gb"] * 1.3 * env_mult["cpu_ram"]), 4)
             required_storage = math.ceil(self.inputs["storage_current_gb"] * 1.2 * env_mult["storage"])
             
+            # Select and price the instance once for both the cost and TCO breakdowns
+            selected_instance = self._select_best_instance(required_vcpus, required_ram)
+            operating_system = self.inputs.get('operating_system', 'linux')
+            pricing = self._get_ec2_pricing_with_os(selected_instance['type'], operating_system)
+            
             return {
                 "requirements": {
                     "vCPUs": required_vcpus,
                     "RAM_GB": required_ram,
                     "storage_GB": required_storage,
-                    "multi_az": env in ["PROD", "PREPROD"],
+                    "multi_az": env in PRODUCTION_ENVIRONMENTS,
                     "operating_system": self.inputs.get('operating_system', 'linux')
                 },
-                "cost_breakdown": self._calculate_basic_costs(required_vcpus, required_ram, required_storage, env),
-                "tco_analysis": self._calculate_tco(required_vcpus, required_ram, env)
+                "cost_breakdown": self._calculate_basic_costs(
+                    required_vcpus, required_ram, required_storage, env, selected_instance, pricing),
+                "tco_analysis": self._calculate_tco(required_vcpus, required_ram, env, selected_instance, pricing)
             }
         except Exception as e:
             logger.error(f"Error calculating standard requirements: {e}")
             return self._get_fallback_requirements(env)
 
-    def _calculate_basic_costs(self, vcpus: int, ram_gb: int, storage_gb: int, env: str) -> Dict[str, Any]:
+    def _calculate_basic_costs(self, vcpus: int, ram_gb: int, storage_gb: int, env: str,
+                               selected_instance: Dict = None, pricing: Dict = None) -> Dict[str, Any]:
         """Calculate basic costs with realistic EC2 pricing including OS differentiation."""
         try:
-            selected_instance = self._select_best_instance(vcpus, ram_gb)
-            instance_type = selected_instance['type']
+            if selected_instance is None:
+                selected_instance = self._select_best_instance(vcpus, ram_gb)
             
             # Get OS-specific pricing
             operating_system = self.inputs.get('operating_system', 'linux')
-            pricing = self._get_ec2_pricing_with_os(instance_type, operating_system)
+            if pricing is None:
+                pricing = self._get_ec2_pricing_with_os(selected_instance['type'], operating_system)
             
-            monthly_instance_cost = {
-                'on_demand': pricing['on_demand'] * 730,
-                'ri_1y_no_upfront': pricing['ri_1y_no_upfront'] * 730,
-                'ri_3y_no_upfront': pricing['ri_3y_no_upfront'] * 730,
-                'spot': pricing['spot'] * 730
-            }
+            monthly_instance_cost = {model: pricing[model] * 730 for model in PRICING_MODELS}
             
             storage_cost_per_gb = 0.08
             monthly_storage_cost = storage_gb * storage_cost_per_gb
             monthly_network_cost = 50
+            fixed_monthly_cost = monthly_storage_cost + monthly_network_cost
             
-            total_costs = {}
-            for pricing_model, instance_cost in monthly_instance_cost.items():
-                total_costs[pricing_model] = instance_cost + monthly_storage_cost + monthly_network_cost
+            total_costs = {model: instance_cost + fixed_monthly_cost
+                           for model, instance_cost in monthly_instance_cost.items()}
             
             return {
                 "total_costs": total_costs,
@@ -3344,42 +3436,22 @@ class EnhancedEnterpriseEC2Calculator:
         base_pricing = self._get_fallback_pricing(instance_type)
         
         # Windows licensing adds approximately 30% to the cost
-        if operating_system.lower() == 'windows':
-            windows_multiplier = 1.3  # 30% increase for Windows licensing
-            
-            for pricing_model in base_pricing:
-                if pricing_model not in ['source', 'last_updated']:
-                    base_pricing[pricing_model] = base_pricing[pricing_model] * windows_multiplier
+        os_key = operating_system.lower()
+        os_multiplier = OS_PRICING_MULTIPLIERS.get(os_key, 1.0)
+        if os_multiplier != 1.0:
+            for pricing_model in PRICING_MODELS:
+                base_pricing[pricing_model] *= os_multiplier
             
             # Update metadata
-            base_pricing['source'] = base_pricing.get('source', 'fallback') + '_windows'
-            base_pricing['os_multiplier'] = windows_multiplier
-        else:
-            base_pricing['os_multiplier'] = 1.0
+            base_pricing['source'] = base_pricing.get('source', 'fallback') + f'_{os_key}'
+        base_pricing['os_multiplier'] = os_multiplier
         
         return base_pricing
 
     def _get_fallback_pricing(self, instance_type: str) -> dict:
         """Get fallback pricing with enhanced instance types."""
         
-        # Enhanced fallback pricing with more instance types
-        fallback_prices = {
-            # General Purpose - M6i instances
-            'm6i.large': {'on_demand': 0.0864, 'ri_1y_no_upfront': 0.0605, 'ri_3y_no_upfront': 0.0432, 'spot': 0.0259},
-            'm6i.xlarge': {'on_demand': 0.1728, 'ri_1y_no_upfront': 0.1210, 'ri_3y_no_upfront': 0.0864, 'spot': 0.0518},
-            'm6i.2xlarge': {'on_demand': 0.3456, 'ri_1y_no_upfront': 0.2419, 'ri_3y_no_upfront': 0.1728, 'spot': 0.1037},
-            'm6i.4xlarge': {'on_demand': 0.6912, 'ri_1y_no_upfront': 0.4838, 'ri_3y_no_upfront': 0.3456, 'spot': 0.2074},
-            
-            # Memory Optimized - R6i instances  
-            'r6i.large': {'on_demand': 0.1008, 'ri_1y_no_upfront': 0.0706, 'ri_3y_no_upfront': 0.0504, 'spot': 0.0302},
-            'r6i.xlarge': {'on_demand': 0.2016, 'ri_1y_no_upfront': 0.1411, 'ri_3y_no_upfront': 0.1008, 'spot': 0.0605},
-            'r6i.2xlarge': {'on_demand': 0.4032, 'ri_1y_no_upfront': 0.2822, 'ri_3y_no_upfront': 0.2016, 'spot': 0.1210},
-            'r6i.4xlarge': {'on_demand': 0.8064, 'ri_1y_no_upfront': 0.5645, 'ri_3y_no_upfront': 0.4032, 'spot': 0.2419},
-        }
-        
-        pricing = fallback_prices.get(instance_type, {
-            'on_demand': 0.1, 'ri_1y_no_upfront': 0.07, 'ri_3y_no_upfront': 0.05, 'spot': 0.03
-        })
+        pricing = dict(FALLBACK_EC2_PRICING.get(instance_type, DEFAULT_FALLBACK_PRICING))
         
         # Add metadata
         pricing.update({
@@ -3395,7 +3467,12 @@ class EnhancedEnterpriseEC2Calculator:
             best_instance = None
             best_score = 0
             
-            for instance in self.INSTANCE_TYPES:
+            for instance in self.INSTANCE_TYPES_BY_VCPU:
+                # Remaining instances have at least this many vCPUs, so even a perfect
+                # RAM fit cannot lift their efficiency above this bound
+                if (required_vcpus / instance['vCPU'] + 1) / 2 <= best_score:
+                    break
+                
                 if instance['vCPU'] >= required_vcpus and instance['RAM'] >= required_ram_gb:
                     cpu_efficiency = required_vcpus / instance['vCPU']
                     ram_efficiency = required_ram_gb / instance['RAM']
@@ -3420,31 +3497,26 @@ class EnhancedEnterpriseEC2Calculator:
             logger.error(f"Error selecting best instance: {e}")
             return {'type': 'm6i.large', 'vCPU': 2, 'RAM': 8, 'family': 'general'}
 
-    def _calculate_tco(self, vcpus: int, ram_gb: int, env: str) -> Dict[str, Any]:
+    def _calculate_tco(self, vcpus: int, ram_gb: int, env: str,
+                       selected_instance: Dict = None, pricing: Dict = None) -> Dict[str, Any]:
         """Calculate TCO analysis with OS-specific pricing."""
         try:
-            selected_instance = self._select_best_instance(vcpus, ram_gb)
             operating_system = self.inputs.get('operating_system', 'linux')
-            pricing = self._get_ec2_pricing_with_os(selected_instance['type'], operating_system)
-            
-            on_demand_monthly = pricing['on_demand'] * 730
-            ri_1y_monthly = pricing['ri_1y_no_upfront'] * 730
-            ri_3y_monthly = pricing['ri_3y_no_upfront'] * 730
+            if pricing is None:
+                if selected_instance is None:
+                    selected_instance = self._select_best_instance(vcpus, ram_gb)
+                pricing = self._get_ec2_pricing_with_os(selected_instance['type'], operating_system)
             
             storage_monthly = max(self.inputs.get('storage_current_gb', 500), 100) * 0.08
             network_monthly = 50
+            fixed_monthly = storage_monthly + network_monthly
             
-            total_on_demand = on_demand_monthly + storage_monthly + network_monthly
-            total_ri_1y = ri_1y_monthly + storage_monthly + network_monthly
-            total_ri_3y = ri_3y_monthly + storage_monthly + network_monthly
-            
-            costs = {
-                'on_demand': total_on_demand,
-                'ri_1y_no_upfront': total_ri_1y,
-                'ri_3y_no_upfront': total_ri_3y
-            }
+            # Monthly total per commitment option (spot is not considered for TCO)
+            costs = {model: pricing[model] * 730 + fixed_monthly
+                     for model in ('on_demand', 'ri_1y_no_upfront', 'ri_3y_no_upfront')}
+            total_on_demand = costs['on_demand']
             
-            best_option = min(costs.keys(), key=lambda k: costs[k])
+            best_option = min(costs, key=costs.get)
             best_cost = costs[best_option]
             savings = total_on_demand - best_cost
             
@@ -3639,12 +3711,123 @@ class EnvironmentHeatMapGenerator:
                              xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
             return fig    
     
+def _to_workload_records(df: pd.DataFrame) -> List[Dict]:
+    """Rename uploaded columns to internal input fields in one pass and return row dicts."""
+    field_mappings = BulkWorkloadAnalyzer.FIELD_MAPPINGS
+    renames = {column: field_mappings[column.lower().strip()] for column in df.columns
+               if isinstance(column, str) and column.lower().strip() in field_mappings}
+    
+    df = df[list(renames)].rename(columns=renames)
+    # When several aliases map to one field the right-most column wins
+    df = df.loc[:, ~df.columns.duplicated(keep='last')]
+    
+    # Normalize whole columns: add missing fields, coerce numerics, then fill blanks with defaults
+    field_defaults = BulkWorkloadAnalyzer.FIELD_DEFAULTS
+    df = df.reindex(columns=list(field_defaults))
+    for field in BulkWorkloadAnalyzer.NUMERIC_FIELDS:
+        df[field] = pd.to_numeric(df[field], errors='coerce').astype(float)
+    df = df.mask(df == '').fillna(field_defaults)
+    
+    return df.astype(object).to_dict('records')
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _parse_bulk_csv(file_bytes: bytes) -> List[Dict]:
+    """Parse an uploaded CSV into row dicts (cached per file content)."""
+    buffer = io.BytesIO(file_bytes)
+    
+    # Read the header first so only columns the analyzer understands are parsed
+    field_mappings = BulkWorkloadAnalyzer.FIELD_MAPPINGS
+    header = pd.read_csv(buffer, nrows=0).columns
+    usecols = [column for column in header
+               if isinstance(column, str) and column.lower().strip() in field_mappings]
+    buffer.seek(0)
+    
+    # Keep text cells verbatim like csv.DictReader did: no "NA"/"None" -> NaN and no
+    # numeric-looking names turned into floats; only numeric fields are coerced later
+    text_columns = {column: str for column in usecols
+                    if field_mappings[column.lower().strip()] not in BulkWorkloadAnalyzer.NUMERIC_FIELDS}
+    # The pyarrow engine infers types first and only then casts to dtype ("007" -> "7"),
+    # so it is only used when there are no text columns to keep verbatim
+    engine = 'pyarrow' if PYARROW_AVAILABLE and not text_columns else 'c'
+    df = pd.read_csv(buffer, usecols=usecols or None, dtype=text_columns, keep_default_na=False, engine=engine)
+    return _to_workload_records(df)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _parse_bulk_excel(file_bytes: bytes) -> List[Dict]:
+    """Parse an uploaded Excel workbook into row dicts (cached per file content)."""
+    return _to_workload_records(pd.read_excel(io.BytesIO(file_bytes), engine='openpyxl'))
+
 class BulkWorkloadAnalyzer:
     """Handle bulk workload analysis from uploaded files."""
     
+    # Fields coerced to float when uploaded records are normalized
+    NUMERIC_FIELDS = frozenset({
+        'on_prem_cores', 'peak_cpu_percent', 'on_prem_ram_gb',
+        'peak_ram_percent', 'storage_current_gb', 'peak_iops',
+        'peak_throughput_mbps', 'infrastructure_age_years'
+    })
+    
+    # Uploaded column name (lower-cased) -> internal input field
+    FIELD_MAPPINGS = {
+        'workload_name': 'workload_name',
+        'name': 'workload_name',
+        'application_name': 'workload_name',
+        'workload_type': 'workload_type',
+        'type': 'workload_type',
+        'application_type': 'workload_type',
+        'operating_system': 'operating_system',
+        'os': 'operating_system',
+        'cpu_cores': 'on_prem_cores',
+        'cores': 'on_prem_cores',
+        'on_prem_cores': 'on_prem_cores',
+        'peak_cpu_percent': 'peak_cpu_percent',
+        'peak_cpu': 'peak_cpu_percent',
+        'cpu_utilization': 'peak_cpu_percent',
+        'ram_gb': 'on_prem_ram_gb',
+        'memory_gb': 'on_prem_ram_gb',
+        'on_prem_ram_gb': 'on_prem_ram_gb',
+        'peak_ram_percent': 'peak_ram_percent',
+        'peak_ram': 'peak_ram_percent',
+        'memory_utilization': 'peak_ram_percent',
+        'storage_gb': 'storage_current_gb',
+        'storage_current_gb': 'storage_current_gb',
+        'disk_gb': 'storage_current_gb',
+        'peak_iops': 'peak_iops',
+        'iops': 'peak_iops',
+        'peak_throughput_mbps': 'peak_throughput_mbps',
+        'throughput_mbps': 'peak_throughput_mbps',
+        'infrastructure_age_years': 'infrastructure_age_years',
+        'age_years': 'infrastructure_age_years',
+        'business_criticality': 'business_criticality',
+        'criticality': 'business_criticality',
+        'region': 'region'
+    }
+    
+    # Defaults applied when a field is missing or blank
+    FIELD_DEFAULTS = {
+        'workload_name': 'Unknown Workload',
+        'workload_type': 'web_application',
+        'operating_system': 'linux',
+        'region': 'us-east-1',
+        'on_prem_cores': 2,
+        'peak_cpu_percent': 70,
+        'on_prem_ram_gb': 8,
+        'peak_ram_percent': 80,
+        'storage_current_gb': 100,
+        'peak_iops': 3000,
+        'peak_throughput_mbps': 100,
+        'infrastructure_age_years': 3,
+        'business_criticality': 'medium'
+    }
+    
+    # Environments analyzed for every uploaded workload
+    ENVIRONMENTS = ('DEV', 'QA', 'UAT', 'PREPROD', 'PROD')
+    
+    # Upper bound on (workload, environment) analyses run concurrently
+    MAX_WORKERS = 16
+    
     def __init__(self):
         self.claude_analyzer = ClaudeAIMigrationAnalyzer()
-        self.calculator = EnhancedEnterpriseEC2Calculator()
         
     def process_bulk_upload(self, uploaded_file, file_type: str) -> Dict[str, Any]:
         """Process bulk upload file and return analysis results."""
@@ -3664,8 +3847,7 @@ class BulkWorkloadAnalyzer:
         """Process CSV file."""
         try:
             # Read CSV content
-            content = uploaded_file.read().decode('utf-8')
-            csv_data = list(csv.DictReader(StringIO(content)))
+            csv_data = _parse_bulk_csv(uploaded_file.getvalue())
             
             return self._analyze_workloads(csv_data)
             
@@ -3679,8 +3861,7 @@ class BulkWorkloadAnalyzer:
                 return {'error': 'openpyxl not available for Excel processing', 'workloads': []}
                 
             # Read Excel content
-            df = pd.read_excel(uploaded_file, engine='openpyxl')
-            workloads_data = df.to_dict('records')
+            workloads_data = _parse_bulk_excel(uploaded_file.getvalue())
             
             return self._analyze_workloads(workloads_data)
             
@@ -3694,131 +3875,78 @@ class BulkWorkloadAnalyzer:
             'successful_analyses': 0,
             'failed_analyses': 0,
             'workloads': [],
-            'summary': {}
+            'summary': {},
+            'timestamp': datetime.now()
         }
         
-        for i, workload_data in enumerate(workloads_data):
-            try:
-                # Validate and normalize workload data
-                normalized_workload = self._normalize_workload_data(workload_data)
-                
-                # Analyze for all environments
-                workload_results = {}
-                for env in ['DEV', 'QA', 'UAT', 'PREPROD', 'PROD']:
-                    env_analysis = self._analyze_single_workload(normalized_workload, env)
-                    workload_results[env] = env_analysis
-                
-                results['workloads'].append({
-                    'index': i + 1,
-                    'workload_name': normalized_workload.get('workload_name', f'Workload {i+1}'),
-                    'status': 'success',
-                    'analysis': workload_results
-                })
-                
-                results['successful_analyses'] += 1
-                
-            except Exception as e:
-                results['workloads'].append({
-                    'index': i + 1,
-                    'workload_name': workload_data.get('workload_name', f'Workload {i+1}'),
-                    'status': 'failed',
-                    'error': str(e)
-                })
-                results['failed_analyses'] += 1
+        # Normalize every row up front and queue one task per distinct (inputs, environment)
+        tasks = {}
+        assignments = []
+        for index, workload_data in enumerate(workloads_data, 1):
+            workload_entry, calculator = self._prepare_workload_row(index, workload_data)
+            results['workloads'].append(workload_entry)
+            if calculator is None:
+                continue
+            
+            # Duplicate rows share one analysis per environment. The name is part of the key
+            # because the Claude prompt includes it.
+            inputs_key = tuple(sorted(calculator.inputs.items()))
+            for env in self.ENVIRONMENTS:
+                task_key = (inputs_key, env)
+                tasks.setdefault(task_key, (calculator, env))
+                assignments.append((workload_entry, env, task_key))
         
-        # Generate summary
-        results['summary'] = self._generate_bulk_summary(results['workloads'])
+        # Tasks are independent, so overlap their pricing and Claude API calls
+        max_workers = max(1, min(self.MAX_WORKERS, len(tasks)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            analyses = dict(zip(tasks, executor.map(
+                lambda task: task[0].calculate_enhanced_requirements(task[1]), tasks.values())))
         
-        return results
-    
-    def _normalize_workload_data(self, workload_data: Dict) -> Dict:
-        """Normalize and validate workload data."""
-        # Define field mappings (CSV column -> internal field)
-        field_mappings = {
-            'workload_name': 'workload_name',
-            'name': 'workload_name',
-            'application_name': 'workload_name',
-            'workload_type': 'workload_type',
-            'type': 'workload_type',
-            'application_type': 'workload_type',
-            'operating_system': 'operating_system',
-            'os': 'operating_system',
-            'cpu_cores': 'on_prem_cores',
-            'cores': 'on_prem_cores',
-            'on_prem_cores': 'on_prem_cores',
-            'peak_cpu_percent': 'peak_cpu_percent',
-            'peak_cpu': 'peak_cpu_percent',
-            'cpu_utilization': 'peak_cpu_percent',
-            'ram_gb': 'on_prem_ram_gb',
-            'memory_gb': 'on_prem_ram_gb',
-            'on_prem_ram_gb': 'on_prem_ram_gb',
-            'peak_ram_percent': 'peak_ram_percent',
-            'peak_ram': 'peak_ram_percent',
-            'memory_utilization': 'peak_ram_percent',
-            'storage_gb': 'storage_current_gb',
-            'storage_current_gb': 'storage_current_gb',
-            'disk_gb': 'storage_current_gb',
-            'peak_iops': 'peak_iops',
-            'iops': 'peak_iops',
-            'peak_throughput_mbps': 'peak_throughput_mbps',
-            'throughput_mbps': 'peak_throughput_mbps',
-            'infrastructure_age_years': 'infrastructure_age_years',
-            'age_years': 'infrastructure_age_years',
-            'business_criticality': 'business_criticality',
-            'criticality': 'business_criticality',
-            'region': 'region'
-        }
+        for workload_entry, env, task_key in assignments:
+            workload_entry['analysis'][env] = analyses[task_key]
         
-        normalized = {}
-        
-        # Normalize field names (case-insensitive)
-        for csv_field, value in workload_data.items():
-            csv_field_lower = csv_field.lower().strip()
-            
-            if csv_field_lower in field_mappings:
-                internal_field = field_mappings[csv_field_lower]
-                normalized[internal_field] = value
-        
-        # Set defaults for missing fields
-        defaults = {
-            'workload_name': 'Unknown Workload',
-            'workload_type': 'web_application',
-            'operating_system': 'linux',
-            'region': 'us-east-1',
-            'on_prem_cores': 2,
-            'peak_cpu_percent': 70,
-            'on_prem_ram_gb': 8,
-            'peak_ram_percent': 80,
-            'storage_current_gb': 100,
-            'peak_iops': 3000,
-            'peak_throughput_mbps': 100,
-            'infrastructure_age_years': 3,
-            'business_criticality': 'medium'
-        }
+        results['successful_analyses'] = sum(1 for w in results['workloads'] if w['status'] == 'success')
+        results['failed_analyses'] = len(results['workloads']) - results['successful_analyses']
         
-        for field, default_value in defaults.items():
-            if field not in normalized or normalized[field] is None or normalized[field] == '':
-                normalized[field] = default_value
-            else:
-                # Convert numeric fields
-                if field in ['on_prem_cores', 'peak_cpu_percent', 'on_prem_ram_gb', 
-                           'peak_ram_percent', 'storage_current_gb', 'peak_iops', 
-                           'peak_throughput_mbps', 'infrastructure_age_years']:
-                    try:
-                        normalized[field] = float(normalized[field])
-                    except (ValueError, TypeError):
-                        normalized[field] = default_value
+        # Generate summary
+        results['summary'] = self._generate_bulk_summary(results['workloads'])
         
-        return normalized
+        return results
     
-    def _analyze_single_workload(self, workload_inputs: Dict, environment: str) -> Dict[str, Any]:
-        """Analyze a single workload for a specific environment."""
-        
-        # Update calculator inputs
-        self.calculator.inputs.update(workload_inputs)
-        
-        # Calculate enhanced requirements
-        return self.calculator.calculate_enhanced_requirements(environment)
+    def _prepare_workload_row(self, index: int, workload_data: Dict) -> Tuple[Dict[str, Any], Optional[EnhancedEnterpriseEC2Calculator]]:
+        """Set up the calculator for one normalized workload record (None if the row is invalid)."""
+        try:
+            # Per-workload calculator with its inputs bound up front, so concurrent tasks never
+            # share inputs; only the stateless Claude analyzer is shared
+            calculator = EnhancedEnterpriseEC2Calculator(inputs=workload_data, claude_analyzer=self.claude_analyzer)
+            
+            return {
+                'index': index,
+                'workload_name': workload_data.get('workload_name', f'Workload {index}'),
+                'status': 'success',
+                'analysis': {}
+            }, calculator
+            
+        except Exception as e:
+            return {
+                'index': index,
+                'workload_name': workload_data.get('workload_name', f'Workload {index}'),
+                'status': 'failed',
+                'error': str(e)
+            }, None
+    
+    def _summary_record(self, workload: Dict) -> Optional[Tuple[float, float, str]]:
+        """Extract PROD monthly cost, complexity score and instance type for the bulk summary."""
+        try:
+            prod_analysis = workload['analysis']['PROD']
+            return (
+                prod_analysis.get('tco_analysis', {}).get('monthly_cost', 0),
+                prod_analysis.get('claude_analysis', {}).get('complexity_score', 0),
+                prod_analysis.get('cost_breakdown', {}).get('selected_instance', {}).get('type', 'Unknown')
+            )
+        except Exception as e:
+            logger.warning(f"Error processing workload summary: {e}")
+            return None
     
     def _generate_bulk_summary(self, workloads: List[Dict]) -> Dict[str, Any]:
         """Generate summary statistics from bulk analysis."""
@@ -3828,52 +3956,31 @@ class BulkWorkloadAnalyzer:
             return {'error': 'No successful analyses to summarize'}
         
         # Aggregate statistics
-        total_monthly_costs = []
-        complexity_scores = []
-        instance_types = {}
+        records = (self._summary_record(w) for w in successful_workloads)
+        df = pd.DataFrame((r for r in records if r is not None),
+                          columns=['monthly_cost', 'complexity_score', 'instance_type'])
         
-        for workload in successful_workloads:
-            try:
-                prod_analysis = workload['analysis']['PROD']
-                
-                # Cost data
-                tco = prod_analysis.get('tco_analysis', {})
-                monthly_cost = tco.get('monthly_cost', 0)
-                if monthly_cost > 0:
-                    total_monthly_costs.append(monthly_cost)
-                
-                # Complexity data
-                claude_analysis = prod_analysis.get('claude_analysis', {})
-                complexity = claude_analysis.get('complexity_score', 0)
-                if complexity > 0:
-                    complexity_scores.append(complexity)
-                
-                # Instance types
-                cost_breakdown = prod_analysis.get('cost_breakdown', {})
-                selected_instance = cost_breakdown.get('selected_instance', {})
-                instance_type = selected_instance.get('type', 'Unknown')
-                instance_types[instance_type] = instance_types.get(instance_type, 0) + 1
-                
-            except Exception as e:
-                logger.warning(f"Error processing workload summary: {e}")
-                continue
+        costs = df.loc[df['monthly_cost'] > 0, 'monthly_cost']
+        complexity_scores = df.loc[df['complexity_score'] > 0, 'complexity_score']
+        instance_counts = df['instance_type'].value_counts(sort=False)
+        total_monthly_cost = float(costs.sum())
         
         # Calculate summary statistics
         summary = {
             'total_workloads_analyzed': len(successful_workloads),
-            'total_monthly_cost': sum(total_monthly_costs),
-            'total_annual_cost': sum(total_monthly_costs) * 12,
-            'average_monthly_cost': sum(total_monthly_costs) / len(total_monthly_costs) if total_monthly_costs else 0,
-            'average_complexity_score': sum(complexity_scores) / len(complexity_scores) if complexity_scores else 0,
-            'most_common_instance_type': max(instance_types.items(), key=lambda x: x[1])[0] if instance_types else 'N/A',
-            'instance_type_distribution': instance_types,
+            'total_monthly_cost': total_monthly_cost,
+            'total_annual_cost': total_monthly_cost * 12,
+            'average_monthly_cost': float(costs.mean()) if not costs.empty else 0,
+            'average_complexity_score': float(complexity_scores.mean()) if not complexity_scores.empty else 0,
+            'most_common_instance_type': instance_counts.idxmax() if not instance_counts.empty else 'N/A',
+            'instance_type_distribution': instance_counts.to_dict(),
             'cost_range': {
-                'min': min(total_monthly_costs) if total_monthly_costs else 0,
-                'max': max(total_monthly_costs) if total_monthly_costs else 0
+                'min': float(costs.min()) if not costs.empty else 0,
+                'max': float(costs.max()) if not costs.empty else 0
             },
             'complexity_range': {
-                'min': min(complexity_scores) if complexity_scores else 0,
-                'max': max(complexity_scores) if complexity_scores else 0
+                'min': float(complexity_scores.min()) if not complexity_scores.empty else 0,
+                'max': float(complexity_scores.max()) if not complexity_scores.empty else 0
             }
         }
         
@@ -3883,20 +3990,17 @@ class BulkWorkloadAnalyzer:
 def initialize_enhanced_session_state():
     """Initialize enhanced session state with vROPS connector."""
     try:
+        # Objects are only constructed on first run; setdefault would build them on every rerun
         if 'enhanced_calculator' not in st.session_state:
             st.session_state.enhanced_calculator = EnhancedEnterpriseEC2Calculator()
-        if 'enhanced_results' not in st.session_state:
-            st.session_state.enhanced_results = None
-        if 'bulk_results' not in st.session_state:
-            st.session_state.bulk_results = None
         if 'vrops_connector' not in st.session_state:
             st.session_state.vrops_connector = VROPSConnector()
-        if 'vrops_connection_status' not in st.session_state:
-            st.session_state.vrops_connection_status = {'status': 'disconnected'}
-        if 'vrops_vms' not in st.session_state:
-            st.session_state.vrops_vms = []
-        if 'selected_vm_metrics' not in st.session_state:
-            st.session_state.selected_vm_metrics = None
+        
+        st.session_state.setdefault('enhanced_results', None)
+        st.session_state.setdefault('bulk_results', None)
+        st.session_state.setdefault('vrops_connection_status', {'status': 'disconnected'})
+        st.session_state.setdefault('vrops_vms', [])
+        st.session_state.setdefault('selected_vm_metrics', None)
             
         logger.info("Session state initialized successfully")
         
@@ -4031,12 +4135,13 @@ def render_vrops_connection_tab():
                         st.session_state.vrops_vms = []
         
         # Display VM List
-        if st.session_state.vrops_vms:
-            st.markdown(f"**Found {len(st.session_state.vrops_vms)} Virtual Machines:**")
+        vrops_vms = st.session_state.vrops_vms
+        if vrops_vms:
+            st.markdown(f"**Found {len(vrops_vms)} Virtual Machines:**")
             
             # Create VM selection
             vm_options = {}
-            for vm in st.session_state.vrops_vms:
+            for vm in vrops_vms:
                 vm_name = vm['name']
                 vm_status = vm.get('resourceStatus', 'Unknown')
                 display_name = f"{vm_name} ({vm_status})"
@@ -4254,22 +4359,7 @@ def render_vm_metrics_summary():
     if st.button("🗑️ Clear Imported Data", key="clear_vrops_data"):
         st.session_state.selected_vm_metrics = None
         # Reset calculator inputs to defaults
-        st.session_state.enhanced_calculator.inputs = {
-            "workload_name": "Sample Enterprise Workload",
-            "workload_type": "web_application",
-            "operating_system": "linux",
-            "region": "us-east-1",
-            "on_prem_cores": 8,
-            "peak_cpu_percent": 70,
-            "on_prem_ram_gb": 32,
-            "peak_ram_percent": 80,
-            "storage_current_gb": 500,
-            "storage_growth_rate": 0.15,
-            "peak_iops": 5000,
-            "peak_throughput_mbps": 250,
-            "infrastructure_age_years": 3,
-            "business_criticality": "medium"
-        }
+        st.session_state.enhanced_calculator.inputs = dict(EnhancedEnterpriseEC2Calculator.DEFAULT_INPUTS)
         st.success("✅ Imported vROPS data cleared. Configuration reset to defaults.")
         st.rerun()
 
@@ -4313,130 +4403,134 @@ def render_enhanced_configuration():
             st.session_state.enhanced_results = None
             st.rerun()
     
-    # Basic workload information
-    with st.expander("📋 Workload Information", expanded=True):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            calculator.inputs["workload_name"] = st.text_input(
-                "Workload Name",
-                value=calculator.inputs["workload_name"],
-                help="Descriptive name for this workload",
-                key="workload_name_input"
-            )
+    # Batch configuration edits in a form so the script reruns once on submit, not on every widget change
+    with st.form("workload_config_form"):
+        # Basic workload information
+        with st.expander("📋 Workload Information", expanded=True):
+            col1, col2 = st.columns(2)
             
-            workload_types = {
-                'web_application': 'Web Application (Frontend, CDN)',
-                'application_server': 'Application Server (APIs, Middleware)',
-                'database_server': 'Database Server (RDBMS, NoSQL)',
-                'file_server': 'File Server (Storage, Backup)',
-                'compute_intensive': 'Compute Intensive (HPC, Analytics)',
-                'analytics_workload': 'Analytics Workload (BI, Data Processing)'
-            }
+            with col1:
+                calculator.inputs["workload_name"] = st.text_input(
+                    "Workload Name",
+                    value=calculator.inputs["workload_name"],
+                    help="Descriptive name for this workload",
+                    key="workload_name_input"
+                )
+                
+                workload_type_options, workload_type_index = _selectbox_choices(
+                    WORKLOAD_TYPE_OPTIONS, WORKLOAD_TYPE_INDEX, calculator.inputs["workload_type"])
+                calculator.inputs["workload_type"] = st.selectbox(
+                    "Workload Type",
+                    workload_type_options,
+                    index=workload_type_index,
+                    format_func=lambda x: WORKLOAD_TYPE_LABELS.get(x, x),
+                    help="Select the primary workload pattern",
+                    key="workload_type_input"
+                )
             
-            calculator.inputs["workload_type"] = st.selectbox(
-                "Workload Type",
-                list(workload_types.keys()),
-                index=list(workload_types.keys()).index(calculator.inputs["workload_type"]),
-                format_func=lambda x: workload_types[x],
-                help="Select the primary workload pattern",
-                key="workload_type_input"
-            )
+            with col2:
+                region_options, region_index = _selectbox_choices(
+                    REGION_OPTIONS, REGION_INDEX, calculator.inputs["region"])
+                calculator.inputs["region"] = st.selectbox(
+                    "Primary AWS Region",
+                    region_options,
+                    index=region_index,
+                    help="Primary AWS region for deployment",
+                    key="region_input"
+                )
+                
+                os_options, os_index = _selectbox_choices(
+                    OS_OPTIONS, OS_INDEX, calculator.inputs["operating_system"])
+                calculator.inputs["operating_system"] = st.selectbox(
+                    "Operating System",
+                    os_options,
+                    index=os_index,
+                    format_func=lambda x: OS_LABELS.get(x, x),
+                    key="os_input"
+                )
         
-        with col2:
-            calculator.inputs["region"] = st.selectbox(
-                "Primary AWS Region",
-                ["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1"],
-                index=["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1"].index(calculator.inputs["region"]),
-                help="Primary AWS region for deployment",
-                key="region_input"
-            )
+        # Infrastructure metrics with change detection
+        with st.expander("🖥️ Current Infrastructure Metrics", expanded=True):
+            col1, col2, col3 = st.columns(3)
             
-            calculator.inputs["operating_system"] = st.selectbox(
-                "Operating System",
-                ["linux", "windows"],
-                index=["linux", "windows"].index(calculator.inputs["operating_system"]),
-                format_func=lambda x: "Linux (Amazon Linux, Ubuntu, RHEL)" if x == "linux" else "Windows Server",
-                key="os_input"
-            )
-    
-    # Infrastructure metrics with change detection
-    with st.expander("🖥️ Current Infrastructure Metrics", expanded=True):
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("**Compute Resources**")
-            calculator.inputs["on_prem_cores"] = st.number_input(
-                "CPU Cores", 
-                min_value=1, 
-                max_value=128, 
-                value=int(calculator.inputs["on_prem_cores"]),
-                key="cpu_cores_input"
-            )
-            calculator.inputs["peak_cpu_percent"] = st.slider(
-                "Peak CPU %", 
-                0, 
-                100, 
-                int(calculator.inputs["peak_cpu_percent"]),
-                key="peak_cpu_input"
-            )
-        
-        with col2:
-            st.markdown("**Memory Resources**")
-            calculator.inputs["on_prem_ram_gb"] = st.number_input(
-                "RAM (GB)", 
-                min_value=1, 
-                max_value=1024, 
-                value=int(calculator.inputs["on_prem_ram_gb"]),
-                key="ram_gb_input"
-            )
-            calculator.inputs["peak_ram_percent"] = st.slider(
-                "Peak RAM %", 
-                0, 
-                100, 
-                int(calculator.inputs["peak_ram_percent"]),
-                key="peak_ram_input"
-            )
-        
-        with col3:
-            st.markdown("**Storage & I/O**")
-            calculator.inputs["storage_current_gb"] = st.number_input(
-                "Storage (GB)", 
-                min_value=1, 
-                value=int(calculator.inputs["storage_current_gb"]),
-                key="storage_gb_input"
-            )
-            calculator.inputs["peak_iops"] = st.number_input(
-                "Peak IOPS", 
-                min_value=1, 
-                value=int(calculator.inputs["peak_iops"]),
-                key="peak_iops_input"
-            )
-    
-    # Business Context
-    with st.expander("🏢 Business Context", expanded=False):
-        col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**Compute Resources**")
+                calculator.inputs["on_prem_cores"] = st.number_input(
+                    "CPU Cores", 
+                    min_value=1, 
+                    max_value=128, 
+                    value=int(calculator.inputs["on_prem_cores"]),
+                    key="cpu_cores_input"
+                )
+                calculator.inputs["peak_cpu_percent"] = st.slider(
+                    "Peak CPU %", 
+                    0, 
+                    100, 
+                    int(calculator.inputs["peak_cpu_percent"]),
+                    key="peak_cpu_input"
+                )
+            
+            with col2:
+                st.markdown("**Memory Resources**")
+                calculator.inputs["on_prem_ram_gb"] = st.number_input(
+                    "RAM (GB)", 
+                    min_value=1, 
+                    max_value=1024, 
+                    value=int(calculator.inputs["on_prem_ram_gb"]),
+                    key="ram_gb_input"
+                )
+                calculator.inputs["peak_ram_percent"] = st.slider(
+                    "Peak RAM %", 
+                    0, 
+                    100, 
+                    int(calculator.inputs["peak_ram_percent"]),
+                    key="peak_ram_input"
+                )
+            
+            with col3:
+                st.markdown("**Storage & I/O**")
+                calculator.inputs["storage_current_gb"] = st.number_input(
+                    "Storage (GB)", 
+                    min_value=1, 
+                    value=int(calculator.inputs["storage_current_gb"]),
+                    key="storage_gb_input"
+                )
+                calculator.inputs["peak_iops"] = st.number_input(
+                    "Peak IOPS", 
+                    min_value=1, 
+                    value=int(calculator.inputs["peak_iops"]),
+                    key="peak_iops_input"
+                )
         
-        with col1:
-            calculator.inputs["business_criticality"] = st.selectbox(
-                "Business Criticality",
-                ["low", "medium", "high", "critical"],
-                index=["low", "medium", "high", "critical"].index(calculator.inputs["business_criticality"]),
-                help="Business impact level of this workload",
-                key="criticality_input"
-            )
+        # Business Context
+        with st.expander("🏢 Business Context", expanded=False):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                criticality_options, criticality_index = _selectbox_choices(
+                    CRITICALITY_OPTIONS, CRITICALITY_INDEX, calculator.inputs["business_criticality"])
+                calculator.inputs["business_criticality"] = st.selectbox(
+                    "Business Criticality",
+                    criticality_options,
+                    index=criticality_index,
+                    help="Business impact level of this workload",
+                    key="criticality_input"
+                )
+            
+            with col2:
+                calculator.inputs["infrastructure_age_years"] = st.number_input(
+                    "Infrastructure Age (Years)",
+                    min_value=0,
+                    max_value=15,
+                    value=int(calculator.inputs["infrastructure_age_years"]),
+                    help="Age of current infrastructure",
+                    key="infra_age_input"
+                )
         
-        with col2:
-            calculator.inputs["infrastructure_age_years"] = st.number_input(
-                "Infrastructure Age (Years)",
-                min_value=0,
-                max_value=15,
-                value=int(calculator.inputs["infrastructure_age_years"]),
-                help="Age of current infrastructure",
-                key="infra_age_input"
-            )
+        st.form_submit_button("✅ Apply Configuration")
     
-    # Check for changes after all inputs
+    # Check for changes after all inputs. current_inputs is a private snapshot,
+    # so it can be stored as the new baseline without copying it again.
     current_inputs = calculator.inputs.copy()
     inputs_changed = st.session_state.original_inputs != current_inputs
     
@@ -4449,7 +4543,7 @@ def render_enhanced_configuration():
     with col1:
         if st.button("🚀 Run Enhanced Analysis", type="primary", key="main_enhanced_analysis_button"):
             # Update original inputs to current state
-            st.session_state.original_inputs = current_inputs.copy()
+            st.session_state.original_inputs = current_inputs
             run_enhanced_analysis()
     
     with col2:
@@ -4460,12 +4554,13 @@ def render_enhanced_configuration():
             calculator.inputs.update(st.session_state.original_inputs)
             st.rerun()
     
-    # Auto-refresh logic
+    # Auto-refresh logic. The results tabs render after this one in the same run,
+    # so they already pick up the new results without forcing a full rerun.
     if auto_refresh and inputs_changed:
-        st.session_state.original_inputs = current_inputs.copy()
+        st.session_state.original_inputs = current_inputs
         with st.spinner("🔄 Auto-refreshing analysis..."):
             run_enhanced_analysis()
-        st.rerun()
+        inputs_changed = False
     
     # Status indicators
     if inputs_changed:
@@ -4478,91 +4573,6 @@ def render_enhanced_configuration():
     elif st.session_state.enhanced_results and inputs_changed:
         st.warning("⚠️ Results shown are based on previous configuration. Re-run analysis to see current results.")
         
-def run_enhanced_analysis():
-    """Run enhanced analysis with improved error handling and status updates."""
-    
-    with st.spinner("🔄 Running enhanced analysis with Claude AI and vROPS data..."):
-        try:
-            calculator = st.session_state.enhanced_calculator
-            
-            if calculator is None:
-                st.error("Calculator not available. Please refresh the page.")
-                return
-            
-            # Get vROPS data if available
-            vrops_data = None
-            if st.session_state.selected_vm_metrics:
-                vrops_data = st.session_state.selected_vm_metrics['processed_metrics']
-            
-            # Show progress
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            # Calculate for all environments
-            results = {}
-            environments = list(calculator.ENV_MULTIPLIERS.keys())
-            
-            for i, env in enumerate(environments):
-                status_text.text(f"Analyzing {env} environment...")
-                progress_bar.progress((i + 1) / len(environments))
-                
-                results[env] = calculator.calculate_enhanced_requirements(env, vrops_data)
-            
-            status_text.text("Generating heat map and finalizing results...")
-            
-            # Generate heat map data
-            heat_map_generator = EnvironmentHeatMapGenerator()
-            heat_map_data = heat_map_generator.generate_heat_map_data(results)
-            heat_map_fig = heat_map_generator.create_heat_map_visualization(heat_map_data)
-            
-            # Store results
-            st.session_state.enhanced_results = {
-                'inputs': calculator.inputs.copy(),
-                'recommendations': results,
-                'heat_map_data': heat_map_data,
-                'heat_map_fig': heat_map_fig,
-                'vrops_enhanced': vrops_data is not None,
-                'timestamp': datetime.now()
-            }
-            
-            # Clear progress indicators
-            progress_bar.empty()
-            status_text.empty()
-            
-            success_message = "✅ Enhanced analysis completed successfully!"
-            if vrops_data:
-                success_message += " 📊 Analysis enhanced with real vROPS performance data!"
-            
-            st.success(success_message)
-            
-            # Show quick summary
-            prod_results = results.get('PROD', {})
-            claude_analysis = prod_results.get('claude_analysis', {})
-            tco_analysis = prod_results.get('tco_analysis', {})
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                complexity = claude_analysis.get('complexity_score', 50)
-                st.metric("Complexity", f"{complexity:.0f}/100")
-            with col2:
-                cost = tco_analysis.get('monthly_cost', 0)
-                st.metric("Monthly Cost", f"${cost:,.0f}")
-            with col3:
-                timeline = claude_analysis.get('estimated_timeline', {}).get('max_weeks', 8)
-                st.metric("Timeline", f"{timeline} weeks")
-            
-        except Exception as e:
-            st.error(f"❌ Error during enhanced analysis: {str(e)}")
-            logger.error(f"Error in enhanced analysis: {e}")
-            # Show detailed error for debugging
-            st.error(f"Debug info: {type(e).__name__}: {str(e)}")
-            
-            # Clear progress indicators on error
-            if 'progress_bar' in locals():
-                progress_bar.empty()
-            if 'status_text' in locals():
-                status_text.empty()
-        
 def show_pricing_source_indicator(pricing_data: Dict[str, Any]):
     """Show pricing source indicator in the main interface."""
     
@@ -4593,10 +4603,24 @@ def run_enhanced_analysis():
             if st.session_state.selected_vm_metrics:
                 vrops_data = st.session_state.selected_vm_metrics['processed_metrics']
             
-            # Calculate for all environments
-            results = {}
-            for env in calculator.ENV_MULTIPLIERS.keys():
-                results[env] = calculator.calculate_enhanced_requirements(env, vrops_data)
+            # Apply the vROPS sizing once up front so worker threads never write shared inputs
+            if vrops_data and vrops_data.get('status') == 'success':
+                calculator._enhance_inputs_with_vrops(vrops_data)
+            
+            script_run_ctx = get_script_run_ctx()
+            
+            def analyze_environment(env: str) -> Dict[str, Any]:
+                # Let st.cache_* helpers called from this worker see the session's script run
+                add_script_run_ctx(threading.current_thread(), script_run_ctx)
+                # Each environment gets its own copy of the inputs; only the stateless analyzer is shared
+                env_calculator = EnhancedEnterpriseEC2Calculator(
+                    inputs=calculator.inputs, claude_analyzer=calculator.claude_analyzer)
+                return env_calculator.calculate_enhanced_requirements(env, vrops_data)
+            
+            # Calculate for all environments concurrently - each one waits on a Claude API call
+            environments = list(calculator.ENV_MULTIPLIERS.keys())
+            with ThreadPoolExecutor(max_workers=len(environments)) as executor:
+                results = dict(zip(environments, executor.map(analyze_environment, environments)))
             
             # Generate heat map data
             heat_map_generator = EnvironmentHeatMapGenerator()
@@ -4609,7 +4633,8 @@ def run_enhanced_analysis():
                 'recommendations': results,
                 'heat_map_data': heat_map_data,
                 'heat_map_fig': heat_map_fig,
-                'vrops_enhanced': vrops_data is not None
+                'vrops_enhanced': vrops_data is not None,
+                'timestamp': datetime.now()
             }
             
             success_message = "✅ Enhanced analysis completed successfully!"
@@ -4622,6 +4647,20 @@ def run_enhanced_analysis():
             st.error(f"❌ Error during enhanced analysis: {str(e)}")
             logger.error(f"Error in enhanced analysis: {e}")
 
+# (label, inputs key) pairs shown in the "Configuration Used for This Analysis" table
+CONFIG_DISPLAY_FIELDS = (
+    ('Workload Name', 'workload_name'),
+    ('Workload Type', 'workload_type'),
+    ('Operating System', 'operating_system'),
+    ('CPU Cores', 'on_prem_cores'),
+    ('RAM (GB)', 'on_prem_ram_gb'),
+    ('Storage (GB)', 'storage_current_gb'),
+    ('Peak CPU %', 'peak_cpu_percent'),
+    ('Peak RAM %', 'peak_ram_percent'),
+    ('Business Criticality', 'business_criticality'),
+    ('AWS Region', 'region')
+)
+
 def render_enhanced_results():
     """Render enhanced analysis results with vROPS insights."""
     
@@ -4764,22 +4803,11 @@ def render_enhanced_results():
         # Show configuration that was analyzed
         if config_changed:
             with st.expander("⚙️ Configuration Used for This Analysis", expanded=False):
-                config_display = analysis_inputs.copy()
-                # Remove sensitive or irrelevant fields
-                display_config = {
-                    'Workload Name': config_display.get('workload_name', 'N/A'),
-                    'Workload Type': config_display.get('workload_type', 'N/A'),
-                    'Operating System': config_display.get('operating_system', 'N/A'),
-                    'CPU Cores': config_display.get('on_prem_cores', 'N/A'),
-                    'RAM (GB)': config_display.get('on_prem_ram_gb', 'N/A'),
-                    'Storage (GB)': config_display.get('storage_current_gb', 'N/A'),
-                    'Peak CPU %': config_display.get('peak_cpu_percent', 'N/A'),
-                    'Peak RAM %': config_display.get('peak_ram_percent', 'N/A'),
-                    'Business Criticality': config_display.get('business_criticality', 'N/A'),
-                    'AWS Region': config_display.get('region', 'N/A')
-                }
-                
-                config_df = pd.DataFrame(list(display_config.items()), columns=['Setting', 'Value'])
+                # Only show the fields listed in CONFIG_DISPLAY_FIELDS (skips sensitive or irrelevant ones)
+                config_df = pd.DataFrame({
+                    'Setting': [label for label, _ in CONFIG_DISPLAY_FIELDS],
+                    'Value': [analysis_inputs.get(key, 'N/A') for _, key in CONFIG_DISPLAY_FIELDS]
+                })
                 st.dataframe(config_df, use_container_width=True, hide_index=True)    
         
         # Claude AI Analysis with vROPS insights
@@ -4809,8 +4837,7 @@ def render_enhanced_results():
                             tasks = step.get('tasks', [])
                             if tasks:
                                 st.markdown("**Key Tasks:**")
-                                for task in tasks[:3]:
-                                    st.markdown(f"• {task}")
+                                st.markdown("\n\n".join(f"• {task}" for task in tasks[:3]))
         
         # vROPS Insights (if available)
         vrops_insights = claude_analysis.get('vrops_insights', {})
@@ -4830,9 +4857,10 @@ def render_enhanced_results():
                 st.markdown(f"• **Recommended Approach:** {vrops_insights.get('recommended_approach', 'N/A')}")
                 
                 # Show vROPS data source
-                if st.session_state.selected_vm_metrics:
-                    vm_info = st.session_state.selected_vm_metrics['vm_info']
-                    collection_period = st.session_state.selected_vm_metrics['collection_period']
+                selected_vm_metrics = st.session_state.selected_vm_metrics
+                if selected_vm_metrics:
+                    vm_info = selected_vm_metrics['vm_info']
+                    collection_period = selected_vm_metrics['collection_period']
                     st.markdown(f"• **Data Source:** {vm_info['name']} ({collection_period} days)")
         
         # Cost Analysis
@@ -4844,8 +4872,8 @@ def render_enhanced_results():
         # ADD THIS: Show pricing source information
         selected_instance = cost_breakdown.get('selected_instance', {})
         if selected_instance:
-            calculator = AWSCostCalculator()
-            instance_pricing = calculator._get_ec2_pricing(selected_instance.get('type', 'm6i.large'))
+            instance_pricing = _get_cost_calculator()._get_ec2_pricing_with_os(
+                selected_instance.get('type', 'm6i.large'), cost_breakdown.get('operating_system', 'linux'))
             show_pricing_source_indicator(instance_pricing)
         
         if total_costs:
@@ -4853,15 +4881,11 @@ def render_enhanced_results():
             
             with col1:
                 st.markdown("**Instance Pricing Comparison**")
-                cost_data = []
-                for pricing_model, cost in total_costs.items():
-                    cost_data.append({
-                        'Pricing Model': pricing_model.replace('_', ' ').title(),
-                        'Monthly Cost': f"${cost:,.2f}",
-                        'Annual Cost': f"${cost*12:,.2f}"
-                    })
-                
-                df_costs = pd.DataFrame(cost_data)
+                df_costs = pd.DataFrame({
+                    'Pricing Model': [model.replace('_', ' ').title() for model in total_costs],
+                    'Monthly Cost': [f"${cost:,.2f}" for cost in total_costs.values()],
+                    'Annual Cost': [f"${cost*12:,.2f}" for cost in total_costs.values()]
+                })
                 st.dataframe(df_costs, use_container_width=True, hide_index=True)
             
             with col2:
@@ -4869,15 +4893,11 @@ def render_enhanced_results():
                 
                 # Calculate detailed service costs if available
                 try:
-                    analyzer = EnhancedEnvironmentAnalyzer()
-                    tech_recs = analyzer.get_technical_recommendations('PROD', prod_results)
-                    cost_calculator = AWSCostCalculator()
-                    service_costs = cost_calculator.calculate_service_costs(
-                        'PROD', tech_recs, prod_results.get('requirements', {}))
+                    _, service_costs = _build_environment_service_costs(
+                        prod_results, 'PROD', _content_key(prod_results))
                     
                     service_cost_data = []
-                    categories = ['compute', 'network', 'storage', 'database', 'security', 'monitoring']
-                    for cat in categories:
+                    for cat in SERVICE_CATEGORIES:
                         if cat in service_costs:
                             service_cost_data.append({
                                 'Service Category': cat.title(),
@@ -4898,7 +4918,7 @@ def render_enhanced_results():
                                                
                         
                         # Show total from service breakdown
-                        total_services = sum(service_costs[cat]['total'] for cat in categories if cat in service_costs)
+                        total_services = sum(service_costs[cat]['total'] for cat in SERVICE_CATEGORIES if cat in service_costs)
                         st.markdown(f"**Total Monthly AWS Services Cost: ${total_services:.2f}**")
                     else:
                         # Fallback to basic cost display
@@ -4930,8 +4950,51 @@ def render_enhanced_results():
         # Show debug information in development
         if st.checkbox("Show debug information", key="debug_results"):
             st.code(f"Error details: {type(e).__name__}: {str(e)}")
-            if 'enhanced_results' in st.session_state:
-                st.json(st.session_state.enhanced_results)
+            if st.session_state.get('enhanced_results'):
+                # Skip the Plotly figure and heat map DataFrame; they are large and not JSON-serializable
+                st.json({key: value for key, value in st.session_state.enhanced_results.items()
+                         if key not in DERIVED_RESULT_FIELDS}, expanded=False)
+
+# Derived from the recommendations and not JSON-serializable, so left out of content keys
+DERIVED_RESULT_FIELDS = ('heat_map_fig', 'heat_map_data')
+
+def _content_key(data: Dict[str, Any]) -> str:
+    """Hash analysis data by content so cached builders shared across sessions never serve another user's output."""
+    content = {key: value for key, value in data.items() if key not in DERIVED_RESULT_FIELDS}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_environment_service_costs(_env_results: Dict[str, Any], env: str, env_results_key: str) -> tuple:
+    """Build technical recommendations and per-service costs for one environment (cached per results content)."""
+    tech_recs = EnhancedEnvironmentAnalyzer().get_technical_recommendations(env, _env_results)
+    service_costs = _get_cost_calculator().calculate_service_costs(
+        env, tech_recs, _env_results.get('requirements', {}))
+    return tech_recs, service_costs
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_complexity_views(_recommendations: Dict[str, Any], recommendations_key: str) -> tuple:
+    """Build per-environment complexity explanations and the breakdown table (cached per recommendations content)."""
+    
+    analyzer = EnhancedEnvironmentAnalyzer()
+    explanations = {
+        env: analyzer.get_detailed_complexity_explanation(env, _recommendations.get(env, {}))
+        for env in analyzer.environments
+    }
+    
+    detailed_data = []
+    for env, complexity_explanation in explanations.items():
+        factors = complexity_explanation['factors']
+        detailed_data.append({
+            'Environment': env,
+            'Overall Score': f"{complexity_explanation['overall_score']:.0f}/100",
+            'Complexity Level': complexity_explanation['complexity_level'],
+            'Resource Intensity': f"{factors['Resource Intensity']['score']:.0f}/100",
+            'Migration Risk': f"{factors['Migration Risk']['score']:.0f}/100",
+            'Operational Complexity': f"{factors['Operational Complexity']['score']:.0f}/100",
+            'Primary Reason': complexity_explanation['detailed_reasons'][0] if complexity_explanation['detailed_reasons'] else 'N/A'
+        })
+    
+    return explanations, pd.DataFrame(detailed_data)
 
 def render_enhanced_environment_heatmap_tab():
     """Render enhanced environment heat map tab with detailed explanations."""
@@ -4943,7 +5006,8 @@ def render_enhanced_environment_heatmap_tab():
         return
     
     results = st.session_state.enhanced_results
-    analyzer = EnhancedEnvironmentAnalyzer()
+    explanations, df_detailed = _build_complexity_views(
+        results['recommendations'], _content_key(results['recommendations']))
     
     # vROPS Enhancement Indicator
     if results.get('vrops_enhanced'):
@@ -4963,7 +5027,7 @@ def render_enhanced_environment_heatmap_tab():
             complexity_level = claude_analysis.get('complexity_level', 'MEDIUM')
             
             # Get detailed explanation
-            complexity_explanation = analyzer.get_detailed_complexity_explanation(env, env_results)
+            complexity_explanation = explanations[env]
             
             # Create expandable card
             with st.expander(f"{env} - {complexity:.0f}/100 ({complexity_level})", expanded=False):
@@ -4986,16 +5050,16 @@ def render_enhanced_environment_heatmap_tab():
                     st.dataframe(df_factors, use_container_width=True, hide_index=True)
                 
                 st.markdown("**Why This Environment is Complex:**")
-                for reason in complexity_explanation['detailed_reasons']:
-                    st.markdown(f"• {reason}")
+                if complexity_explanation['detailed_reasons']:
+                    st.markdown("\n\n".join(f"• {reason}" for reason in complexity_explanation['detailed_reasons']))
                 
                 st.markdown("**Specific Challenges:**")
-                for challenge in complexity_explanation['specific_challenges'][:3]:
-                    st.markdown(f"• {challenge}")
+                if complexity_explanation['specific_challenges']:
+                    st.markdown("\n\n".join(f"• {challenge}" for challenge in complexity_explanation['specific_challenges'][:3]))
                 
                 st.markdown("**Mitigation Strategies:**")
-                for strategy in complexity_explanation['mitigation_strategies'][:3]:
-                    st.markdown(f"• {strategy}")
+                if complexity_explanation['mitigation_strategies']:
+                    st.markdown("\n\n".join(f"• {strategy}" for strategy in complexity_explanation['mitigation_strategies'][:3]))
     
     # Heat map visualization
     st.markdown("#### Impact Heat Map Visualization")
@@ -5006,27 +5070,82 @@ def render_enhanced_environment_heatmap_tab():
     # Detailed complexity breakdown table
     st.markdown("#### Detailed Complexity Breakdown by Environment")
     
-    detailed_data = []
-    
-    for env in environments:
-        env_results = results['recommendations'].get(env, {})
-        complexity_explanation = analyzer.get_detailed_complexity_explanation(env, env_results)
-        
-        factors = complexity_explanation['factors']
-        
-        detailed_data.append({
-            'Environment': env,
-            'Overall Score': f"{complexity_explanation['overall_score']:.0f}/100",
-            'Complexity Level': complexity_explanation['complexity_level'],
-            'Resource Intensity': f"{factors['Resource Intensity']['score']:.0f}/100",
-            'Migration Risk': f"{factors['Migration Risk']['score']:.0f}/100",
-            'Operational Complexity': f"{factors['Operational Complexity']['score']:.0f}/100",
-            'Primary Reason': complexity_explanation['detailed_reasons'][0] if complexity_explanation['detailed_reasons'] else 'N/A'
-        })
-    
-    df_detailed = pd.DataFrame(detailed_data)
     st.dataframe(df_detailed, use_container_width=True, hide_index=True)
 
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_cost_distribution_pie(labels: tuple, values: tuple) -> go.Figure:
+    """Build the monthly cost distribution donut chart (cached per label/value set)."""
+    
+    # Create a more visually appealing pie chart
+    largest = max(values)
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=values,
+        hole=.4,  # Donut chart
+        textinfo='label+percent+value',
+        textposition='auto',
+        textfont=dict(size=14),
+        marker=dict(
+            colors=['#3b82f6', '#ef4444', '#10b981', '#f59e0b', '#8b5cf6', '#06b6d4'],
+            line=dict(color='#FFFFFF', width=2)
+        ),
+        hovertemplate='<b>%{label}</b><br>' +
+                     'Cost: $%{value:.2f}<br>' +
+                     'Percentage: %{percent}<br>' +
+                     '<extra></extra>',
+        pull=[0.05 if val == largest else 0 for val in values]  # Pull out the largest slice
+    )])
+    
+    fig_pie.update_layout(
+        title=dict(
+            text="Monthly Cost Distribution",
+            x=0.5,
+            font=dict(size=18, color='#1f2937')
+        ),
+        height=500,
+        width=700,
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.05,
+            font=dict(size=12)
+        ),
+        margin=dict(l=20, r=120, t=60, b=20),
+        annotations=[
+            dict(
+                text=f"Total<br>${sum(values):.2f}/month",
+                x=0.5, y=0.5,
+                font_size=16,
+                font_color='#1f2937',
+                showarrow=False
+            )
+        ]
+    )
+    
+    return fig_pie
+
+def render_service_cost_breakdown(category_costs: Dict[str, Any], item_label: str):
+    """Render the per-service cost table for one technical category."""
+    services = [service for service in category_costs if service not in ('total', 'optimization_notes')]
+    df_costs = pd.DataFrame({
+        item_label: [service.replace('_', ' ').title() for service in services],
+        'Monthly Cost': [f"${category_costs[service]['cost']:.2f}" for service in services],
+        'Details': [category_costs[service]['details'] for service in services]
+    })
+    st.dataframe(df_costs, use_container_width=True, hide_index=True)
+
+# Static checklist shown on the Security tab, joined once at import
+SECURITY_BEST_PRACTICES_MARKDOWN = "\n\n".join((
+    "🔐 Implement least privilege access principles",
+    "🔍 Enable comprehensive audit logging",
+    "🛡️ Use AWS Config for compliance monitoring",
+    "🚨 Set up GuardDuty for threat detection",
+    "📊 Regular security assessments and penetration testing"
+))
+
 def render_technical_recommendations_tab():
     """Render comprehensive technical recommendations tab with cost details."""
     
@@ -5037,8 +5156,6 @@ def render_technical_recommendations_tab():
         return
     
     results = st.session_state.enhanced_results
-    analyzer = EnhancedEnvironmentAnalyzer()
-    cost_calculator = AWSCostCalculator()
     
     # vROPS Enhancement Indicator
     if results.get('vrops_enhanced'):
@@ -5058,9 +5175,8 @@ def render_technical_recommendations_tab():
         return
     
     # Get technical recommendations and costs
-    tech_recs = analyzer.get_technical_recommendations(selected_env, env_results)
+    tech_recs, service_costs = _build_environment_service_costs(env_results, selected_env, _content_key(env_results))
     requirements = env_results.get('requirements', {})
-    service_costs = cost_calculator.calculate_service_costs(selected_env, tech_recs, requirements)
     
     st.markdown(f"## {selected_env} Environment - Technical Specifications & Costs")
     
@@ -5091,63 +5207,15 @@ def render_technical_recommendations_tab():
     # Cost breakdown chart
     st.markdown("#### Cost Breakdown by Service Category")
     
-    categories = ['compute', 'network', 'storage', 'database', 'security', 'monitoring']
-    costs = [service_costs[cat]['total'] for cat in categories]
+    costs = [service_costs[cat]['total'] for cat in SERVICE_CATEGORIES]
     
     # Filter out zero costs to avoid clutter
-    filtered_data = [(cat.title(), cost) for cat, cost in zip(categories, costs) if cost > 0]
+    filtered_data = [(cat.title(), cost) for cat, cost in zip(SERVICE_CATEGORIES, costs) if cost > 0]
     
     if filtered_data:
         labels, values = zip(*filtered_data)
         
-        # Create a more visually appealing pie chart
-        fig_pie = go.Figure(data=[go.Pie(
-            labels=labels,
-            values=values,
-            hole=.4,  # Donut chart
-            textinfo='label+percent+value',
-            textposition='auto',
-            textfont=dict(size=14),
-            marker=dict(
-                colors=['#3b82f6', '#ef4444', '#10b981', '#f59e0b', '#8b5cf6', '#06b6d4'],
-                line=dict(color='#FFFFFF', width=2)
-            ),
-            hovertemplate='<b>%{label}</b><br>' +
-                         'Cost: $%{value:.2f}<br>' +
-                         'Percentage: %{percent}<br>' +
-                         '<extra></extra>',
-            pull=[0.05 if max(values) == val else 0 for val in values]  # Pull out the largest slice
-        )])
-        
-        fig_pie.update_layout(
-            title=dict(
-                text="Monthly Cost Distribution",
-                x=0.5,
-                font=dict(size=18, color='#1f2937')
-            ),
-            height=500,
-            width=700,
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="middle",
-                y=0.5,
-                xanchor="left",
-                x=1.05,
-                font=dict(size=12)
-            ),
-            margin=dict(l=20, r=120, t=60, b=20),
-            annotations=[
-                dict(
-                    text=f"Total<br>${sum(values):.2f}/month",
-                    x=0.5, y=0.5,
-                    font_size=16,
-                    font_color='#1f2937',
-                    showarrow=False
-                )
-            ]
-        )
-        
+        fig_pie = _build_cost_distribution_pie(labels, values)
         st.plotly_chart(fig_pie, use_container_width=True)
     else:
         st.warning("No cost data available for visualization.")
@@ -5184,17 +5252,7 @@ def render_technical_recommendations_tab():
         with col2:
             st.markdown("**Compute Cost Breakdown**")
             
-            cost_breakdown_data = []
-            for service, details in compute_costs.items():
-                if service != 'total' and service != 'optimization_notes':
-                    cost_breakdown_data.append({
-                        'Service': service.replace('_', ' ').title(),
-                        'Monthly Cost': f"${details['cost']:.2f}",
-                        'Details': details['details']
-                    })
-            
-            df_compute_costs = pd.DataFrame(cost_breakdown_data)
-            st.dataframe(df_compute_costs, use_container_width=True, hide_index=True)
+            render_service_cost_breakdown(compute_costs, 'Service')
         
         # Deployment configuration
         st.markdown("**Deployment Configuration**")
@@ -5210,8 +5268,9 @@ def render_technical_recommendations_tab():
         
         # Cost optimization notes
         st.markdown("**💡 Cost Optimization Recommendations**")
-        for note in compute_costs.get('optimization_notes', []):
-            st.markdown(note)
+        optimization_notes = compute_costs.get('optimization_notes', [])
+        if optimization_notes:
+            st.markdown("\n\n".join(optimization_notes))
     
     # Network tab with costs
     with tech_tabs[1]:
@@ -5241,17 +5300,7 @@ def render_technical_recommendations_tab():
         with col2:
             st.markdown("**Network Cost Breakdown**")
             
-            network_cost_data = []
-            for service, details in network_costs.items():
-                if service != 'total' and service != 'optimization_notes':
-                    network_cost_data.append({
-                        'Service': service.replace('_', ' ').title(),
-                        'Monthly Cost': f"${details['cost']:.2f}",
-                        'Details': details['details']
-                    })
-            
-            df_network_costs = pd.DataFrame(network_cost_data)
-            st.dataframe(df_network_costs, use_container_width=True, hide_index=True)
+            render_service_cost_breakdown(network_costs, 'Service')
         
         # Advanced network services
         st.markdown("**Advanced Network Services**")
@@ -5268,8 +5317,9 @@ def render_technical_recommendations_tab():
         
         # Cost optimization notes
         st.markdown("**💡 Network Cost Optimization**")
-        for note in network_costs.get('optimization_notes', []):
-            st.markdown(note)
+        optimization_notes = network_costs.get('optimization_notes', [])
+        if optimization_notes:
+            st.markdown("\n\n".join(optimization_notes))
     
     # Storage tab with costs
     with tech_tabs[2]:
@@ -5299,17 +5349,7 @@ def render_technical_recommendations_tab():
         with col2:
             st.markdown("**Storage Cost Breakdown**")
             
-            storage_cost_data = []
-            for service, details in storage_costs.items():
-                if service != 'total' and service != 'optimization_notes':
-                    storage_cost_data.append({
-                        'Storage Type': service.replace('_', ' ').title(),
-                        'Monthly Cost': f"${details['cost']:.2f}",
-                        'Details': details['details']
-                    })
-            
-            df_storage_costs = pd.DataFrame(storage_cost_data)
-            st.dataframe(df_storage_costs, use_container_width=True, hide_index=True)
+            render_service_cost_breakdown(storage_costs, 'Storage Type')
         
         # Data protection
         st.markdown("**Data Protection & Management**")
@@ -5326,8 +5366,9 @@ def render_technical_recommendations_tab():
         
         # Cost optimization notes
         st.markdown("**💡 Storage Cost Optimization**")
-        for note in storage_costs.get('optimization_notes', []):
-            st.markdown(note)
+        optimization_notes = storage_costs.get('optimization_notes', [])
+        if optimization_notes:
+            st.markdown("\n\n".join(optimization_notes))
     
     # Database tab with costs
     with tech_tabs[3]:
@@ -5357,17 +5398,7 @@ def render_technical_recommendations_tab():
         with col2:
             st.markdown("**Database Cost Breakdown**")
             
-            db_cost_data = []
-            for service, details in db_costs.items():
-                if service != 'total' and service != 'optimization_notes':
-                    db_cost_data.append({
-                        'Database Component': service.replace('_', ' ').title(),
-                        'Monthly Cost': f"${details['cost']:.2f}",
-                        'Details': details['details']
-                    })
-            
-            df_db_costs = pd.DataFrame(db_cost_data)
-            st.dataframe(df_db_costs, use_container_width=True, hide_index=True)
+            render_service_cost_breakdown(db_costs, 'Database Component')
         
         # Advanced database features
         st.markdown("**Advanced Database Features**")
@@ -5384,8 +5415,9 @@ def render_technical_recommendations_tab():
         
         # Cost optimization notes
         st.markdown("**💡 Database Cost Optimization**")
-        for note in db_costs.get('optimization_notes', []):
-            st.markdown(note)
+        optimization_notes = db_costs.get('optimization_notes', [])
+        if optimization_notes:
+            st.markdown("\n\n".join(optimization_notes))
     
     # Security tab with costs
     with tech_tabs[4]:
@@ -5412,36 +5444,18 @@ def render_technical_recommendations_tab():
         with col2:
             st.markdown("**Security Cost Breakdown**")
             
-            security_cost_data = []
-            for service, details in security_costs.items():
-                if service != 'total' and service != 'optimization_notes':
-                    security_cost_data.append({
-                        'Security Service': service.replace('_', ' ').title(),
-                        'Monthly Cost': f"${details['cost']:.2f}",
-                        'Details': details['details']
-                    })
-            
-            df_security_costs = pd.DataFrame(security_cost_data)
-            st.dataframe(df_security_costs, use_container_width=True, hide_index=True)
+            render_service_cost_breakdown(security_costs, 'Security Service')
         
         # Security best practices
         st.markdown("**Security Best Practices for this Environment:**")
         
-        security_practices = [
-            "🔐 Implement least privilege access principles",
-            "🔍 Enable comprehensive audit logging",
-            "🛡️ Use AWS Config for compliance monitoring",
-            "🚨 Set up GuardDuty for threat detection",
-            "📊 Regular security assessments and penetration testing"
-        ]
-        
-        for practice in security_practices:
-            st.markdown(practice)
+        st.markdown(SECURITY_BEST_PRACTICES_MARKDOWN)
         
         # Cost optimization notes
         st.markdown("**💡 Security Cost Optimization**")
-        for note in security_costs.get('optimization_notes', []):
-            st.markdown(note)
+        optimization_notes = security_costs.get('optimization_notes', [])
+        if optimization_notes:
+            st.markdown("\n\n".join(optimization_notes))
     
     # Monitoring tab with costs
     with tech_tabs[5]:
@@ -5471,17 +5485,7 @@ def render_technical_recommendations_tab():
         with col2:
             st.markdown("**Monitoring Cost Breakdown**")
             
-            monitoring_cost_data = []
-            for service, details in monitoring_costs.items():
-                if service != 'total' and service != 'optimization_notes':
-                    monitoring_cost_data.append({
-                        'Monitoring Service': service.replace('_', ' ').title(),
-                        'Monthly Cost': f"${details['cost']:.2f}",
-                        'Details': details['details']
-                    })
-            
-            df_monitoring_costs = pd.DataFrame(monitoring_cost_data)
-            st.dataframe(df_monitoring_costs, use_container_width=True, hide_index=True)
+            render_service_cost_breakdown(monitoring_costs, 'Monitoring Service')
         
         # Advanced monitoring services
         st.markdown("**Advanced Monitoring Services**")
@@ -5498,36 +5502,38 @@ def render_technical_recommendations_tab():
         
         # Cost optimization notes
         st.markdown("**💡 Monitoring Cost Optimization**")
-        for note in monitoring_costs.get('optimization_notes', []):
-            st.markdown(note)
+        optimization_notes = monitoring_costs.get('optimization_notes', [])
+        if optimization_notes:
+            st.markdown("\n\n".join(optimization_notes))
 
 # Bulk upload and reporting functions
-def generate_bulk_template():
-    """Downloadable CSV template for bulk upload."""
-    import io
-
-    sample_data = {
-        "workload_name": ["App 1", "DB 1"],
-        "cpu_cores": [4, 8],
-        "ram_gb": [16, 32],
-        "storage_gb": [200, 500],
-        "workload_type": ["web_application", "database_server"],
-        "operating_system": ["linux", "windows"],
-        "peak_cpu_percent": [70, 85],
-        "peak_ram_percent": [75, 90],
-        "peak_iops": [3000, 6000],
-        "business_criticality": ["medium", "high"],
-        "region": ["us-east-1", "us-east-1"]
-    }
+# Example rows for the downloadable bulk upload template
+BULK_TEMPLATE_SAMPLE_DATA = {
+    "workload_name": ["App 1", "DB 1"],
+    "cpu_cores": [4, 8],
+    "ram_gb": [16, 32],
+    "storage_gb": [200, 500],
+    "workload_type": ["web_application", "database_server"],
+    "operating_system": ["linux", "windows"],
+    "peak_cpu_percent": [70, 85],
+    "peak_ram_percent": [75, 90],
+    "peak_iops": [3000, 6000],
+    "business_criticality": ["medium", "high"],
+    "region": ["us-east-1", "us-east-1"]
+}
 
-    df = pd.DataFrame(sample_data)
-    output = io.BytesIO()
-    df.to_csv(output, index=False)
-    output.seek(0)
+@st.cache_data(show_spinner=False)
+def _bulk_template_csv() -> bytes:
+    """Serialize the bulk upload template to CSV bytes once per process."""
+    buffer = io.BytesIO()
+    pd.DataFrame(BULK_TEMPLATE_SAMPLE_DATA).to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
 
+def generate_bulk_template():
+    """Downloadable CSV template for bulk upload."""
     st.download_button(
         label="⬇️ Click to Download CSV Template",
-        data=output,
+        data=_bulk_template_csv(),
         file_name="bulk_upload_template.csv",
         mime="text/csv"
     )
@@ -5653,14 +5659,20 @@ def render_bulk_results():
     # Add detailed tabs for bulk workloads
     if results['successful_analyses'] > 0:
         st.markdown("#### 🔍 Detailed Workload Analysis")
+        
+        # Name -> workload lookup (first occurrence wins for duplicate names)
+        successful_workloads = {}
+        for w in results['workloads']:
+            if w['status'] == 'success':
+                successful_workloads.setdefault(w['workload_name'], w)
+        
         selected_workload = st.selectbox(
             "Select Workload for Detailed View",
-            [w['workload_name'] for w in results['workloads'] if w['status'] == 'success']
+            list(successful_workloads)
         )
         
         if selected_workload:
-            workload_data = next(w for w in results['workloads'] 
-                             if w['workload_name'] == selected_workload and w['status'] == 'success')
+            workload_data = successful_workloads[selected_workload]
             
             # Create tabs for detailed analysis
             detailed_tabs = st.tabs(["Analysis", "Heat Map", "Recommendations"])
@@ -5736,22 +5748,24 @@ def render_workload_analysis(workload_data):
         st.markdown("### 💡 Key Recommendations")
         recommendations = claude_analysis.get('recommendations', [])
         if recommendations:
-            for i, rec in enumerate(recommendations[:5], 1):
-                st.markdown(f"{i}. {rec}")
+            st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(recommendations[:5], 1)))
                 
     except Exception as e:
         st.error(f"❌ Error displaying workload analysis: {str(e)}")
         logger.error(f"Error in render_workload_analysis: {e}")
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_workload_heat_map(workload_analysis: Dict[str, Any]) -> go.Figure:
+    """Generate heat map data and figure for one bulk workload (cached per analysis)."""
+    heat_map_generator = EnvironmentHeatMapGenerator()
+    heat_map_data = heat_map_generator.generate_heat_map_data(workload_analysis)
+    return heat_map_generator.create_heat_map_visualization(heat_map_data)
+
 def render_workload_heatmaps(workload_data):
     """Render heatmaps for a specific workload."""
     st.markdown(f"### 🌡️ Environment Heat Map for {workload_data['workload_name']}")
     
-    # Generate heat map data
-    heat_map_generator = EnvironmentHeatMapGenerator()
-    heat_map_data = heat_map_generator.generate_heat_map_data(workload_data['analysis'])
-    heat_map_fig = heat_map_generator.create_heat_map_visualization(heat_map_data)
-    
+    heat_map_fig = _build_workload_heat_map(workload_data['analysis'])
     st.plotly_chart(heat_map_fig, use_container_width=True)
 
 def render_workload_recommendations(workload_data):
@@ -5763,7 +5777,7 @@ def render_workload_recommendations(workload_data):
         env = 'PROD'  # Focus on production environment
         env_results = workload_data['analysis'][env]
         tech_recs = analyzer.get_technical_recommendations(env, env_results)
-        cost_calculator = AWSCostCalculator()
+        cost_calculator = _get_cost_calculator()
         requirements = env_results.get('requirements', {})
         service_costs = cost_calculator.calculate_service_costs(env, tech_recs, requirements)
         
@@ -5794,6 +5808,118 @@ def render_workload_recommendations(workload_data):
         st.error(f"❌ Error displaying technical recommendations: {str(e)}")
         logger.error(f"Error in render_workload_recommendations: {e}")
 
+def _bulk_workload_row(workload: Dict[str, Any]) -> List[Any]:
+    """Flatten one bulk workload result into a row of the Workloads sheet."""
+    if workload['status'] != 'success':
+        return [workload['workload_name'], "❌ Failed", "N/A", "N/A", "N/A", "N/A",
+                workload.get('error', 'Analysis failed')]
+    
+    prod_analysis = workload['analysis']['PROD']
+    claude_analysis = prod_analysis.get('claude_analysis', {})
+    tco_analysis = prod_analysis.get('tco_analysis', {})
+    selected_instance = prod_analysis.get('cost_breakdown', {}).get('selected_instance', {})
+    
+    return [
+        workload['workload_name'],
+        "✅ Success",
+        f"{claude_analysis.get('complexity_score', 0):.0f}/100",
+        f"${tco_analysis.get('monthly_cost', 0):,.2f}",
+        selected_instance.get('type', 'N/A'),
+        claude_analysis.get('estimated_timeline', {}).get('max_weeks', 'N/A'),
+        claude_analysis.get('migration_strategy', {}).get('approach', 'N/A')
+    ]
+
+def _build_bulk_excel_bytes(results: Dict[str, Any]) -> bytes:
+    """Build the bulk analysis workbook and return its bytes."""
+    import openpyxl
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    
+    # Create Excel workbook
+    wb = openpyxl.Workbook()
+    ws_summary = wb.active
+    ws_summary.title = "Summary"
+    
+    # Define styles
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="2563EB", end_color="2563EB", fill_type="solid")
+    data_font = Font(size=11)
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    
+    # Add summary data
+    ws_summary['A1'] = "Bulk Workload Analysis Summary"
+    ws_summary['A1'].font = Font(bold=True, size=16)
+    ws_summary.merge_cells('A1:D1')
+    
+    summary = results.get('summary', {})
+    if 'error' in summary:
+        ws_summary['A3'] = "Error: " + summary['error']
+        ws_summary['A3'].font = Font(color="FF0000")
+    else:
+        # Summary metrics
+        summary_data = [
+            ["Total Workloads", summary.get('total_workloads_analyzed', 0)],
+            ["Total Monthly Cost", f"${summary.get('total_monthly_cost', 0):,.2f}"],
+            ["Average Monthly Cost", f"${summary.get('average_monthly_cost', 0):,.2f}"],
+            ["Average Complexity", f"{summary.get('average_complexity_score', 0):.1f}/100"],
+            ["Most Common Instance", summary.get('most_common_instance_type', 'N/A')]
+        ]
+        
+        # Write summary data
+        for i, (metric, value) in enumerate(summary_data, 3):
+            ws_summary[f'A{i}'] = metric
+            ws_summary[f'B{i}'] = value
+            
+            if i == 3:  # Header row
+                ws_summary[f'A{i}'].font = header_font
+                ws_summary[f'A{i}'].fill = header_fill
+                ws_summary[f'B{i}'].font = header_font
+                ws_summary[f'B{i}'].fill = header_fill
+            else:
+                ws_summary[f'A{i}'].font = data_font
+                ws_summary[f'B{i}'].font = data_font
+            
+            ws_summary[f'A{i}'].border = border
+            ws_summary[f'B{i}'].border = border
+    
+    # Workloads sheet
+    ws_workloads = wb.create_sheet("Workloads")
+    
+    # Headers
+    headers = ["Workload", "Status", "Complexity", "Monthly Cost", "Instance Type", "Timeline (weeks)", "Migration Strategy"]
+    for col_idx, header in enumerate(headers, 1):
+        cell = ws_workloads.cell(row=1, column=col_idx, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.border = border
+        cell.alignment = Alignment(horizontal='center')
+    
+    # Workload data, streamed row by row
+    for row in (_bulk_workload_row(workload) for workload in results.get('workloads', [])):
+        ws_workloads.append(row)
+        
+        # Apply formatting
+        for cell in ws_workloads[ws_workloads.max_row]:
+            cell.font = data_font
+            cell.border = border
+    
+    # Auto-adjust column widths
+    for sheet in wb:
+        for column in sheet.columns:
+            column_letter = openpyxl.utils.get_column_letter(column[0].column)
+            max_length = max((len(str(cell.value)) for cell in column), default=0)
+            adjusted_width = (max_length + 2) * 1.2
+            sheet.column_dimensions[column_letter].width = adjusted_width
+    
+    # Save to BytesIO buffer
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
 def export_bulk_results_to_excel(results):
     """Export bulk results to Excel."""
     if not OPENPYXL_AVAILABLE:
@@ -5801,126 +5927,14 @@ def export_bulk_results_to_excel(results):
         return
     
     try:
-        # Create Excel workbook
-        wb = openpyxl.Workbook()
-        ws_summary = wb.active
-        ws_summary.title = "Summary"
-        
-        # Define styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="2563EB", end_color="2563EB", fill_type="solid")
-        data_font = Font(size=11)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Add summary data
-        ws_summary['A1'] = "Bulk Workload Analysis Summary"
-        ws_summary['A1'].font = Font(bold=True, size=16)
-        ws_summary.merge_cells('A1:D1')
-        
-        summary = results.get('summary', {})
-        if 'error' in summary:
-            ws_summary['A3'] = "Error: " + summary['error']
-            ws_summary['A3'].font = Font(color="FF0000")
-        else:
-            # Summary metrics
-            summary_data = [
-                ["Total Workloads", summary.get('total_workloads_analyzed', 0)],
-                ["Total Monthly Cost", f"${summary.get('total_monthly_cost', 0):,.2f}"],
-                ["Average Monthly Cost", f"${summary.get('average_monthly_cost', 0):,.2f}"],
-                ["Average Complexity", f"{summary.get('average_complexity_score', 0):.1f}/100"],
-                ["Most Common Instance", summary.get('most_common_instance_type', 'N/A')]
-            ]
-            
-            # Write summary data
-            for i, (metric, value) in enumerate(summary_data, 3):
-                ws_summary[f'A{i}'] = metric
-                ws_summary[f'B{i}'] = value
-                
-                if i == 3:  # Header row
-                    ws_summary[f'A{i}'].font = header_font
-                    ws_summary[f'A{i}'].fill = header_fill
-                    ws_summary[f'B{i}'].font = header_font
-                    ws_summary[f'B{i}'].fill = header_fill
-                else:
-                    ws_summary[f'A{i}'].font = data_font
-                    ws_summary[f'B{i}'].font = data_font
-                
-                ws_summary[f'A{i}'].border = border
-                ws_summary[f'B{i}'].border = border
-        
-        # Workloads sheet
-        ws_workloads = wb.create_sheet("Workloads")
-        
-        # Headers
-        headers = ["Workload", "Status", "Complexity", "Monthly Cost", "Instance Type", "Timeline (weeks)", "Migration Strategy"]
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws_workloads.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-            cell.alignment = Alignment(horizontal='center')
-        
-        # Workload data
-        for row_idx, workload in enumerate(results.get('workloads', []), 2):
-            if workload['status'] == 'success':
-                prod_analysis = workload['analysis']['PROD']
-                claude_analysis = prod_analysis.get('claude_analysis', {})
-                tco_analysis = prod_analysis.get('tco_analysis', {})
-                cost_breakdown = prod_analysis.get('cost_breakdown', {})
-                selected_instance = cost_breakdown.get('selected_instance', {})
-                
-                ws_workloads.cell(row=row_idx, column=1, value=workload['workload_name'])
-                ws_workloads.cell(row=row_idx, column=2, value="✅ Success")
-                ws_workloads.cell(row=row_idx, column=3, value=f"{claude_analysis.get('complexity_score', 0):.0f}/100")
-                ws_workloads.cell(row=row_idx, column=4, value=f"${tco_analysis.get('monthly_cost', 0):,.2f}")
-                ws_workloads.cell(row=row_idx, column=5, value=selected_instance.get('type', 'N/A'))
-                ws_workloads.cell(row=row_idx, column=6, value=claude_analysis.get('estimated_timeline', {}).get('max_weeks', 'N/A'))
-                ws_workloads.cell(row=row_idx, column=7, value=claude_analysis.get('migration_strategy', {}).get('approach', 'N/A'))
-            else:
-                ws_workloads.cell(row=row_idx, column=1, value=workload['workload_name'])
-                ws_workloads.cell(row=row_idx, column=2, value="❌ Failed")
-                ws_workloads.cell(row=row_idx, column=3, value="N/A")
-                ws_workloads.cell(row=row_idx, column=4, value="N/A")
-                ws_workloads.cell(row=row_idx, column=5, value="N/A")
-                ws_workloads.cell(row=row_idx, column=6, value="N/A")
-                ws_workloads.cell(row=row_idx, column=7, value=workload.get('error', 'Analysis failed'))
-            
-            # Apply formatting
-            for col_idx in range(1, len(headers) + 1):
-                cell = ws_workloads.cell(row=row_idx, column=col_idx)
-                cell.font = data_font
-                cell.border = border
-        
-        # Auto-adjust column widths
-        for sheet in wb:
-            for column in sheet.columns:
-                max_length = 0
-                column_letter = openpyxl.utils.get_column_letter(column[0].column)
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2) * 1.2
-                sheet.column_dimensions[column_letter].width = adjusted_width
-        
-        # Save to BytesIO buffer
-        buffer = io.BytesIO()
-        wb.save(buffer)
-        buffer.seek(0)
+        excel_bytes = _build_bulk_excel_bytes(results)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"bulk_workload_analysis_{timestamp}.xlsx"
         
         st.download_button(
             label="⬇️ Download Excel Report",
-            data=buffer.getvalue(),
+            data=excel_bytes,
             file_name=filename,
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             key="bulk_excel_report_download"
@@ -5932,6 +5946,94 @@ def export_bulk_results_to_excel(results):
         st.error(f"Error generating Excel report: {str(e)}")
         logger.error(f"Error in bulk Excel generation: {e}")
 
+@st.cache_resource
+def _pdf_styles():
+    """Build the reportlab stylesheet shared by the PDF reports once per process."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Title'],
+        fontSize=20,
+        spaceAfter=20,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor('#1f2937'),
+        fontName='Helvetica-Bold'
+    ))
+    styles.add(ParagraphStyle('VROPSNote', parent=styles['Normal'], fontSize=12,
+                              textColor=colors.HexColor('#0f766e'), fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, alignment=TA_CENTER,
+                              textColor=colors.HexColor('#6b7280')))
+    return styles
+
+@st.cache_resource
+def _pdf_summary_table_style():
+    """Build the two-column summary table style shared by the PDF reports once per process."""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib import colors
+    
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1f2937')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
+        ('FONTSIZE', (0, 1), (-1, -1), 10)
+    ])
+
+def _build_bulk_pdf_bytes(results: Dict[str, Any]) -> bytes:
+    """Render the bulk analysis PDF report and return its bytes."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+    from reportlab.lib.units import inch
+    
+    # Create PDF content
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*inch, leftMargin=0.75*inch)
+    
+    styles = _pdf_styles()
+    
+    # Title and Executive Summary heading
+    story = [
+        Paragraph("Bulk Workload Analysis Report with vROPS Integration", styles['CustomTitle']),
+        Paragraph(
+            f"Enterprise AWS Migration Analysis<br/>Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}",
+            styles['Normal']),
+        Spacer(1, 0.5*inch),
+        Paragraph("Executive Summary", styles['Heading1'])
+    ]
+    
+    summary = results.get('summary', {})
+    if 'error' in summary:
+        story.append(Paragraph(f"Error: {summary['error']}", styles['Normal']))
+    else:
+        summary_data = [
+            ['Metric', 'Value'],
+            ['Total Workloads Analyzed', str(summary.get('total_workloads_analyzed', 0))],
+            ['Total Monthly Cost', f"${summary.get('total_monthly_cost', 0):,.2f}"],
+            ['Total Annual Cost', f"${summary.get('total_annual_cost', 0):,.2f}"],
+            ['Average Monthly Cost', f"${summary.get('average_monthly_cost', 0):,.2f}"],
+            ['Average Complexity Score', f"{summary.get('average_complexity_score', 0):.1f}/100"],
+            ['Most Common Instance Type', summary.get('most_common_instance_type', 'N/A')]
+        ]
+        
+        summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
+        summary_table.setStyle(_pdf_summary_table_style())
+        
+        story.extend([summary_table, Spacer(1, 0.3*inch)])
+    
+    # Footer
+    footer_text = f"Bulk Analysis Report generated by Enhanced AWS Migration Platform v7.0 with vROPS Integration on {datetime.now().strftime('%B %d, %Y')}"
+    story.extend([Spacer(1, 0.3*inch), Paragraph(footer_text, styles['Footer'])])
+    
+    # Build PDF
+    doc.build(story)
+    return buffer.getvalue()
+
 def export_bulk_results_to_pdf(results):
     """Export enhanced bulk results to PDF with detailed analysis for each workload."""
     if not REPORTLAB_AVAILABLE:
@@ -5939,85 +6041,14 @@ def export_bulk_results_to_pdf(results):
         return
     
     try:
-        # Create PDF content
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*inch, leftMargin=0.75*inch)
-        
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Title'],
-            fontSize=20,
-            spaceAfter=20,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#1f2937'),
-            fontName='Helvetica-Bold'
-        )
-        
-        subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            spaceAfter=15,
-            textColor=colors.HexColor('#2563eb'),
-            fontName='Helvetica-Bold'
-        )
-        
-        story = []
-        
-        # Title
-        story.append(Paragraph("Bulk Workload Analysis Report with vROPS Integration", title_style))
-        story.append(Paragraph("Enterprise AWS Migration Analysis", styles['Normal']))
-        story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", styles['Normal']))
-        story.append(Spacer(1, 0.5*inch))
-        
-        # Executive Summary
-        story.append(Paragraph("Executive Summary", styles['Heading1']))
-        
-        summary = results.get('summary', {})
-        if 'error' in summary:
-            story.append(Paragraph(f"Error: {summary['error']}", styles['Normal']))
-        else:
-            summary_data = [
-                ['Metric', 'Value'],
-                ['Total Workloads Analyzed', str(summary.get('total_workloads_analyzed', 0))],
-                ['Total Monthly Cost', f"${summary.get('total_monthly_cost', 0):,.2f}"],
-                ['Total Annual Cost', f"${summary.get('total_annual_cost', 0):,.2f}"],
-                ['Average Monthly Cost', f"${summary.get('average_monthly_cost', 0):,.2f}"],
-                ['Average Complexity Score', f"{summary.get('average_complexity_score', 0):.1f}/100"],
-                ['Most Common Instance Type', summary.get('most_common_instance_type', 'N/A')]
-            ]
-            
-            summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1f2937')),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
-                ('FONTSIZE', (0, 1), (-1, -1), 10)
-            ]))
-            
-            story.append(summary_table)
-            story.append(Spacer(1, 0.3*inch))
-        
-        # Footer
-        story.append(Spacer(1, 0.3*inch))
-        footer_text = f"Bulk Analysis Report generated by Enhanced AWS Migration Platform v7.0 with vROPS Integration on {datetime.now().strftime('%B %d, %Y')}"
-        footer_style = ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, alignment=TA_CENTER, textColor=colors.HexColor('#6b7280'))
-        story.append(Paragraph(footer_text, footer_style))
-        
-        # Build PDF
-        doc.build(story)
-        buffer.seek(0)
+        pdf_bytes = _build_bulk_pdf_bytes(results)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"bulk_workload_analysis_vrops_{timestamp}.pdf"
         
         st.download_button(
             label="⬇️ Download PDF Report",
-            data=buffer.getvalue(),
+            data=pdf_bytes,
             file_name=filename,
             mime="application/pdf",
             key="bulk_pdf_report_download"
@@ -6029,6 +6060,101 @@ def export_bulk_results_to_pdf(results):
         st.error(f"Error generating PDF: {str(e)}")
         logger.error(f"Error in bulk PDF generation: {e}")
 
+def _build_enhanced_excel_bytes(results: Dict[str, Any]) -> bytes:
+    """Build the single-workload Excel report and return its bytes."""
+    import openpyxl
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    
+    # Create Excel workbook
+    wb = openpyxl.Workbook()
+    
+    # Remove default sheet
+    wb.remove(wb.active)
+    
+    # Define styles
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="2563EB", end_color="2563EB", fill_type="solid")
+    title_font = Font(bold=True, size=14)
+    data_font = Font(size=11)
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    center_alignment = Alignment(horizontal='center')
+    
+    # Sheet 1: Executive Summary
+    ws_summary = wb.create_sheet("Executive Summary")
+    
+    # Add title
+    ws_summary['A1'] = "AWS Migration Analysis - Executive Summary"
+    ws_summary['A1'].font = title_font
+    ws_summary.merge_cells('A1:E1')
+    
+    # Add generation date
+    ws_summary['A2'] = f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
+    ws_summary['A2'].font = Font(size=11, italic=True)
+    ws_summary.merge_cells('A2:E2')
+    
+    # vROPS enhancement note
+    if results.get('vrops_enhanced'):
+        ws_summary['A3'] = "Enhanced with vRealize Operations performance data"
+        ws_summary['A3'].font = Font(size=11, italic=True, color="0F766E")
+        ws_summary.merge_cells('A3:E3')
+    
+    ws_summary.append([])  # Empty row
+    
+    # Summary data from analysis
+    prod_results = results['recommendations']['PROD']
+    claude_analysis = prod_results.get('claude_analysis', {})
+    tco_analysis = prod_results.get('tco_analysis', {})
+    
+    summary_rows = [
+        ["Analysis Summary", ""],
+        ["Migration Complexity",
+         f"{claude_analysis.get('complexity_level', 'MEDIUM')} ({claude_analysis.get('complexity_score', 50):.0f}/100)"],
+        ["Estimated Timeline", f"{claude_analysis.get('estimated_timeline', {}).get('max_weeks', 8)} weeks"],
+        ["Monthly Cost (PROD)", f"${tco_analysis.get('monthly_cost', 0):,.2f}"],
+        ["Annual Cost (PROD)", f"${tco_analysis.get('monthly_cost', 0) * 12:,.2f}"],
+        ["Best Pricing Option", tco_analysis.get('best_pricing_option', 'N/A').replace('_', ' ').title()],
+        []  # Empty row
+    ]
+    
+    # vROPS insights if available
+    vrops_insights = claude_analysis.get('vrops_insights', {})
+    if vrops_insights and results.get('vrops_enhanced'):
+        summary_rows.extend([
+            ["vROPS Performance Insights", ""],
+            ["Performance Impact", vrops_insights.get('performance_impact', 'N/A')],
+            ["Sizing Confidence", vrops_insights.get('sizing_confidence', 'N/A')],
+            ["Optimization Potential", vrops_insights.get('optimization_potential', 'N/A')],
+            ["Recommended Approach", vrops_insights.get('recommended_approach', 'N/A')]
+        ])
+    
+    for row in summary_rows:
+        ws_summary.append(row)
+    
+    # Apply styles
+    section_header_rows = {5, 12 if results.get('vrops_enhanced') else 11}
+    section_header_font = Font(bold=True)
+    for row in ws_summary.iter_rows():
+        for cell in row:
+            cell.border = border
+            if cell.row == 1:
+                cell.font = title_font
+            elif cell.row in section_header_rows:  # Section headers
+                cell.font = section_header_font
+    
+    # Auto-adjust column widths
+    ws_summary.column_dimensions['A'].width = 25
+    ws_summary.column_dimensions['B'].width = 40
+    
+    # Save to BytesIO buffer
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
 def generate_enhanced_excel_report():
     """Generate comprehensive Excel report with multiple sheets for enhanced analysis."""
     
@@ -6044,94 +6170,13 @@ def generate_enhanced_excel_report():
         results = st.session_state.enhanced_results
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Create Excel workbook
-        wb = openpyxl.Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
-        
-        # Define styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="2563EB", end_color="2563EB", fill_type="solid")
-        title_font = Font(bold=True, size=14)
-        data_font = Font(size=11)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        center_alignment = Alignment(horizontal='center')
-        
-        # Sheet 1: Executive Summary
-        ws_summary = wb.create_sheet("Executive Summary")
-        
-        # Add title
-        ws_summary['A1'] = "AWS Migration Analysis - Executive Summary"
-        ws_summary['A1'].font = title_font
-        ws_summary.merge_cells('A1:E1')
-        
-        # Add generation date
-        ws_summary['A2'] = f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
-        ws_summary['A2'].font = Font(size=11, italic=True)
-        ws_summary.merge_cells('A2:E2')
-        
-        # vROPS enhancement note
-        if results.get('vrops_enhanced'):
-            ws_summary['A3'] = "Enhanced with vRealize Operations performance data"
-            ws_summary['A3'].font = Font(size=11, italic=True, color="0F766E")
-            ws_summary.merge_cells('A3:E3')
-        
-        ws_summary.append([])  # Empty row
-        
-        # Summary data from analysis
-        prod_results = results['recommendations']['PROD']
-        claude_analysis = prod_results.get('claude_analysis', {})
-        tco_analysis = prod_results.get('tco_analysis', {})
-        
-        ws_summary.append(["Analysis Summary", ""])
-        ws_summary.append(["Migration Complexity", 
-                          f"{claude_analysis.get('complexity_level', 'MEDIUM')} ({claude_analysis.get('complexity_score', 50):.0f}/100)"])
-        ws_summary.append(["Estimated Timeline", 
-                          f"{claude_analysis.get('estimated_timeline', {}).get('max_weeks', 8)} weeks"])
-        ws_summary.append(["Monthly Cost (PROD)", f"${tco_analysis.get('monthly_cost', 0):,.2f}"])
-        ws_summary.append(["Annual Cost (PROD)", f"${tco_analysis.get('monthly_cost', 0) * 12:,.2f}"])
-        ws_summary.append(["Best Pricing Option", 
-                          tco_analysis.get('best_pricing_option', 'N/A').replace('_', ' ').title()])
-        ws_summary.append([])  # Empty row
-        
-        # vROPS insights if available
-        vrops_insights = claude_analysis.get('vrops_insights', {})
-        if vrops_insights and results.get('vrops_enhanced'):
-            ws_summary.append(["vROPS Performance Insights", ""])
-            ws_summary.append(["Performance Impact", vrops_insights.get('performance_impact', 'N/A')])
-            ws_summary.append(["Sizing Confidence", vrops_insights.get('sizing_confidence', 'N/A')])
-            ws_summary.append(["Optimization Potential", vrops_insights.get('optimization_potential', 'N/A')])
-            ws_summary.append(["Recommended Approach", vrops_insights.get('recommended_approach', 'N/A')])
-        
-        # Apply styles
-        for row in ws_summary.iter_rows():
-            for cell in row:
-                cell.border = border
-                if cell.row == 1:
-                    cell.font = title_font
-                elif cell.row in [5, 12 if results.get('vrops_enhanced') else 11]:  # Section headers
-                    cell.font = Font(bold=True)
-        
-        # Auto-adjust column widths
-        ws_summary.column_dimensions['A'].width = 25
-        ws_summary.column_dimensions['B'].width = 40
-        
-        # Save to BytesIO buffer
-        buffer = io.BytesIO()
-        wb.save(buffer)
-        buffer.seek(0)
+        excel_bytes = _build_enhanced_excel_bytes(results)
         
         filename = f"Enhanced_AWS_Migration_Analysis_vROPS_{timestamp}.xlsx"
         
         st.download_button(
             label="⬇️ Download Excel Report",
-            data=buffer.getvalue(),
+            data=excel_bytes,
             file_name=filename,
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             key="excel_report_download"
@@ -6143,6 +6188,66 @@ def generate_enhanced_excel_report():
         st.error(f"Error generating Excel report: {str(e)}")
         logger.error(f"Error in Excel generation: {e}")
 
+def _build_enhanced_pdf_bytes(results: Dict[str, Any]) -> bytes:
+    """Render the enhanced single-workload PDF report and return its bytes."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, PageBreak
+    from reportlab.lib.units import inch
+    
+    # Create PDF content
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*inch, leftMargin=0.75*inch)
+    
+    styles = _pdf_styles()
+    
+    # Title
+    story = [
+        Paragraph("Enhanced AWS Migration Analysis with vROPS Integration", styles['CustomTitle']),
+        Paragraph(
+            f"Enterprise Corporation<br/>Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}",
+            styles['Normal'])
+    ]
+    
+    # vROPS enhancement note
+    if results.get('vrops_enhanced'):
+        story.append(Paragraph("Enhanced with vRealize Operations performance data", styles['VROPSNote']))
+    
+    # Executive Summary
+    story.extend([Spacer(1, 0.5*inch), Paragraph("Executive Summary", styles['Heading1'])])
+    
+    prod_results = results['recommendations']['PROD']
+    claude_analysis = prod_results.get('claude_analysis', {})
+    tco_analysis = prod_results.get('tco_analysis', {})
+    
+    summary_data = [
+        ['Metric', 'Value'],
+        ['Workload Name', results['inputs']['workload_name']],
+        ['Migration Complexity', f"{claude_analysis.get('complexity_level', 'MEDIUM')} ({claude_analysis.get('complexity_score', 50):.0f}/100)"],
+        ['Estimated Timeline', f"{claude_analysis.get('estimated_timeline', {}).get('max_weeks', 8)} weeks"],
+        ['Monthly Cost', f"${tco_analysis.get('monthly_cost', 0):,.2f}"],
+        ['Best Pricing Option', tco_analysis.get('best_pricing_option', 'N/A').replace('_', ' ').title()]
+    ]
+    
+    # Add vROPS insights if available
+    vrops_insights = claude_analysis.get('vrops_insights', {})
+    if vrops_insights and results.get('vrops_enhanced'):
+        summary_data.extend([
+            ['Performance Assessment', vrops_insights.get('performance_impact', 'N/A')],
+            ['Sizing Confidence', vrops_insights.get('sizing_confidence', 'N/A')],
+            ['Recommended Approach', vrops_insights.get('recommended_approach', 'N/A')]
+        ])
+    
+    summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
+    summary_table.setStyle(_pdf_summary_table_style())
+    
+    # Footer
+    footer_text = f"Report generated by Enhanced AWS Migration Platform v7.0 with vROPS Integration on {datetime.now().strftime('%B %d, %Y')}"
+    story.extend([summary_table, PageBreak(), Spacer(1, 0.3*inch), Paragraph(footer_text, styles['Footer'])])
+    
+    # Build PDF
+    doc.build(story)
+    return buffer.getvalue()
+
 def generate_enhanced_pdf_report():
     """Generate enhanced PDF report with vROPS integration."""
     
@@ -6158,92 +6263,13 @@ def generate_enhanced_pdf_report():
         results = st.session_state.enhanced_results
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Create PDF content
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*inch, leftMargin=0.75*inch)
-        
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Title'],
-            fontSize=20,
-            spaceAfter=20,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#1f2937'),
-            fontName='Helvetica-Bold'
-        )
-        
-        story = []
-        
-        # Title
-        story.append(Paragraph("Enhanced AWS Migration Analysis with vROPS Integration", title_style))
-        story.append(Paragraph("Enterprise Corporation", styles['Normal']))
-        story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", styles['Normal']))
-        
-        # vROPS enhancement note
-        if results.get('vrops_enhanced'):
-            story.append(Paragraph("Enhanced with vRealize Operations performance data", 
-                                 ParagraphStyle('VROPSNote', parent=styles['Normal'], 
-                                              fontSize=12, textColor=colors.HexColor('#0f766e'), 
-                                              fontName='Helvetica-Bold')))
-        
-        story.append(Spacer(1, 0.5*inch))
-        
-        # Executive Summary
-        prod_results = results['recommendations']['PROD']
-        claude_analysis = prod_results.get('claude_analysis', {})
-        tco_analysis = prod_results.get('tco_analysis', {})
-        
-        story.append(Paragraph("Executive Summary", styles['Heading1']))
-        
-        summary_data = [
-            ['Metric', 'Value'],
-            ['Workload Name', results['inputs']['workload_name']],
-            ['Migration Complexity', f"{claude_analysis.get('complexity_level', 'MEDIUM')} ({claude_analysis.get('complexity_score', 50):.0f}/100)"],
-            ['Estimated Timeline', f"{claude_analysis.get('estimated_timeline', {}).get('max_weeks', 8)} weeks"],
-            ['Monthly Cost', f"${tco_analysis.get('monthly_cost', 0):,.2f}"],
-            ['Best Pricing Option', tco_analysis.get('best_pricing_option', 'N/A').replace('_', ' ').title()]
-        ]
-        
-        # Add vROPS insights if available
-        vrops_insights = claude_analysis.get('vrops_insights', {})
-        if vrops_insights and results.get('vrops_enhanced'):
-            summary_data.extend([
-                ['Performance Assessment', vrops_insights.get('performance_impact', 'N/A')],
-                ['Sizing Confidence', vrops_insights.get('sizing_confidence', 'N/A')],
-                ['Recommended Approach', vrops_insights.get('recommended_approach', 'N/A')]
-            ])
-        
-        summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1f2937')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
-            ('FONTSIZE', (0, 1), (-1, -1), 10)
-        ]))
-        
-        story.append(summary_table)
-        story.append(PageBreak())
-        
-        # Footer
-        story.append(Spacer(1, 0.3*inch))
-        footer_text = f"Report generated by Enhanced AWS Migration Platform v7.0 with vROPS Integration on {datetime.now().strftime('%B %d, %Y')}"
-        footer_style = ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, alignment=TA_CENTER, textColor=colors.HexColor('#6b7280'))
-        story.append(Paragraph(footer_text, footer_style))
-        
-        # Build PDF
-        doc.build(story)
-        buffer.seek(0)
+        pdf_bytes = _build_enhanced_pdf_bytes(results)
         
         filename = f"Enhanced_AWS_Migration_Report_vROPS_{timestamp}.pdf"
         
         st.download_button(
             label="⬇️ Download Enhanced PDF Report",
-            data=buffer.getvalue(),
+            data=pdf_bytes,
             file_name=filename,
             mime="application/pdf",
             key="pdf_report_download"
@@ -6269,7 +6295,7 @@ def show_aws_connection_status():
     """Show enhanced AWS connection status in the sidebar."""
     try:
         # Check AWS connection status through the cost calculator
-        cost_calculator = AWSCostCalculator()
+        cost_calculator = _get_cost_calculator()
         status = cost_calculator.get_connection_status()
         
         if status['connected']:
@@ -6291,6 +6317,12 @@ def show_aws_connection_status():
         logger.error(f"Error in show_aws_connection_status: {e}")
 
 
+def _heat_map_csv(heat_map_data: pd.DataFrame) -> bytes:
+    """Serialize the heat map data to CSV bytes."""
+    buffer = io.BytesIO()
+    heat_map_data.to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
+
 def main():
     """Enhanced main application with vROPS integration and nested tab structure."""
     
@@ -6396,11 +6428,12 @@ def main():
         """)
         
         # Quick stats if results available
-        if st.session_state.enhanced_results:
+        enhanced_results = st.session_state.enhanced_results
+        if enhanced_results:
             st.markdown("---")
             st.markdown("### 📈 Quick Stats")
             
-            prod_results = st.session_state.enhanced_results['recommendations'].get('PROD', {})
+            prod_results = enhanced_results['recommendations'].get('PROD', {})
             claude_analysis = prod_results.get('claude_analysis', {})
             tco_analysis = prod_results.get('tco_analysis', {})
             
@@ -6410,7 +6443,7 @@ def main():
             st.metric("Complexity Score", f"{complexity_score:.0f}/100")
             st.metric("Monthly Cost", f"${monthly_cost:,.0f}")
             
-            if st.session_state.enhanced_results.get('vrops_enhanced'):
+            if enhanced_results.get('vrops_enhanced'):
                 st.markdown("📊 **Enhanced with vROPS data**")
     
     # MAIN TABS - Updated structure with vROPS Integration
@@ -6456,10 +6489,10 @@ def main():
         st.info("💡 Reports will be generated based on your current analysis context (Single Workload or Bulk Analysis)")
         
         # Check which type of results we have
-        has_single_results = st.session_state.enhanced_results is not None
-        has_bulk_results = ('bulk_results' in st.session_state and 
-                           st.session_state.bulk_results is not None and 
-                           'error' not in st.session_state.bulk_results)
+        enhanced_results = st.session_state.enhanced_results
+        bulk_results = st.session_state.get('bulk_results')
+        has_single_results = enhanced_results is not None
+        has_bulk_results = bulk_results is not None and 'error' not in bulk_results
         
         if has_single_results or has_bulk_results:
             # Show report type selector
@@ -6481,7 +6514,7 @@ def main():
                 st.markdown("#### Single Workload Reports")
                 
                 # vROPS enhancement indicator
-                if st.session_state.enhanced_results.get('vrops_enhanced'):
+                if enhanced_results.get('vrops_enhanced'):
                     st.success("📊 Reports will include vRealize Operations performance insights")
                 
                 col1, col2, col3 = st.columns(3)
@@ -6496,8 +6529,8 @@ def main():
                 
                 with col3:
                     if st.button("📈 Generate Heat Map CSV", key="reports_heatmap_csv"):
-                        if 'heat_map_data' in st.session_state.enhanced_results:
-                            csv_data = st.session_state.enhanced_results['heat_map_data'].to_csv(index=False)
+                        if 'heat_map_data' in enhanced_results:
+                            csv_data = _heat_map_csv(enhanced_results['heat_map_data'])
                             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                             st.download_button(
                                 "⬇️ Download Heat Map CSV",
@@ -6509,13 +6542,13 @@ def main():
                 
                 # Report preview for single workload
                 st.markdown("#### Report Preview")
-                prod_results = st.session_state.enhanced_results['recommendations']['PROD']
+                prod_results = enhanced_results['recommendations']['PROD']
                 claude_analysis = prod_results.get('claude_analysis', {})
                 
                 st.markdown("**Executive Summary Preview:**")
                 
                 summary_preview = f"""
-                **Workload:** {st.session_state.enhanced_results['inputs']['workload_name']}
+                **Workload:** {enhanced_results['inputs']['workload_name']}
                 
                 **Migration Complexity:** {claude_analysis.get('complexity_level', 'MEDIUM')} ({claude_analysis.get('complexity_score', 50):.0f}/100)
                 
@@ -6529,15 +6562,15 @@ def main():
                 st.markdown(summary_preview)
                 
                 recommendations = claude_analysis.get('recommendations', [])
-                for i, rec in enumerate(recommendations[:3], 1):
-                    st.markdown(f"{i}. {rec}")
+                if recommendations:
+                    st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(recommendations[:3], 1)))
                 
                 if len(recommendations) > 3:
                     st.markdown(f"... and {len(recommendations) - 3} more recommendations in the full report")
                 
                 # vROPS insights preview
                 vrops_insights = claude_analysis.get('vrops_insights', {})
-                if vrops_insights and st.session_state.enhanced_results.get('vrops_enhanced'):
+                if vrops_insights and enhanced_results.get('vrops_enhanced'):
                     st.markdown("**vROPS Performance Insights:**")
                     st.markdown(f"• **Performance Impact:** {vrops_insights.get('performance_impact', 'N/A')}")
                     st.markdown(f"• **Sizing Confidence:** {vrops_insights.get('sizing_confidence', 'N/A')}")
@@ -6549,13 +6582,12 @@ def main():
                 col1, col2 = st.columns(2)
                 with col1:
                     if st.button("📊 Export to Excel", key="bulk_excel_export_reports"):
-                        export_bulk_results_to_excel(st.session_state.bulk_results)
+                        export_bulk_results_to_excel(bulk_results)
                 with col2:
                     if st.button("📄 Generate PDF Report", key="bulk_pdf_export_reports"):
-                        export_bulk_results_to_pdf(st.session_state.bulk_results)
+                        export_bulk_results_to_pdf(bulk_results)
                 
                 # Show bulk summary
-                bulk_results = st.session_state.bulk_results
                 summary = bulk_results.get('summary', {})
                 
                 if 'error' not in summary:
@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+streamlit_app = pytest.importorskip("streamlit_app")
+
+
+def test_parse_bulk_csv_keeps_text_cells_verbatim():
+    csv_bytes = b"workload_name,cpu_cores,criticality\n007,4,NA\n1.10,,true\n"
+
+    records = streamlit_app._parse_bulk_csv(csv_bytes)
+
+    assert [record["workload_name"] for record in records] == ["007", "1.10"]
+    assert [record["business_criticality"] for record in records] == ["NA", "true"]
+    assert records[0]["on_prem_cores"] == 4
+    assert records[1]["on_prem_cores"] == streamlit_app.BulkWorkloadAnalyzer.FIELD_DEFAULTS["on_prem_cores"]